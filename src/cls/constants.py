@@ -1 +1,16 @@
-INF = int(1e9)
\ No newline at end of file
+INF   = int(1e9)
+EMPTY = frozenset()
+
+REASONS = (
+    'Full',
+    'Incompatible shift',
+    'Already attending a parallel session',
+    'Incompatible classmate/s',
+    'Incompatible with groupmate/s',
+    'Already attending',
+    'Grade level incompatible',
+    'Incompatible with subject',
+    'Incompatible with category',
+    'Incompatible with sections',
+    'Section closed'
+)
\ No newline at end of file
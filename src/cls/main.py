@@ -1,8 +1,19 @@
 from __future__        import annotations
 from src.cls.constants import INF
+from src.cls.constants import EMPTY
+from src.cls.constants import REASONS
+from enum              import IntEnum
+from functools         import reduce
+from operator          import or_
+from heapq             import heapify
+from heapq             import heappush
+from heapq             import heappop
+from typing            import Iterable
 
 
 class Capacity:
+    __slots__ = ('_minimum', '_ideal', '_maximum', '_filled')
+
     def __init__(
         self,
         minimum: int,
@@ -78,8 +89,16 @@ class Capacity:
         self.maximum += other.maximum
         self.filled  += other.filled
 
+    def decrease(self, other: Capacity) -> None:
+        self.filled  -= other.filled
+        self.minimum -= other.minimum
+        self.ideal   -= other.ideal
+        self.maximum -= other.maximum
+
 
 class Shift:
+    __slots__ = ('_id', '_partitions', '_indices', '_mask')
+
     def __init__(
         self,
         id        : str      = None,
@@ -87,6 +106,8 @@ class Shift:
     ) -> None:
         self._id         = id
         self._partitions = partitions or set()
+        self._indices    = dict[str, int]()
+        self._mask       = int()
 
     def __repr__(self) -> str:
         return self.id
@@ -99,14 +120,34 @@ class Shift:
     def partitions(self) -> set[str]:
         return self._partitions
 
-    def add(self, partition: str) -> None:
+    @property
+    def mask(self) -> int:
+        return self._mask
+
+    def bit(self, partition: str) -> int:
+        index = self._indices.get(partition)
+        if index is None:
+            return int()
+        else:
+            return 1 << index
+
+    def add(
+        self,
+        partition: str,
+        index    : int = None
+    ) -> None:
         if partition in self.partitions:
             raise Exception()
         else:
             self._partitions.add(partition)
+            if index is not None:
+                self._indices[partition] = index
+                self._mask |= 1 << index
 
 
 class ParallelSession:
+    __slots__ = ('_name', '_shift', '_partition', '_index', '_mask')
+
     def __init__(
         self,
         shift    : Shift,
@@ -118,6 +159,7 @@ class ParallelSession:
         self._shift     = shift
         self._partition = partition
         self._index     = index
+        self._mask      = shift.bit(partition)
 
     def __repr__(self) -> str:
         return self.name
@@ -138,8 +180,31 @@ class ParallelSession:
     def index(self) -> int | None:
         return self._index
 
+    @property
+    def mask(self) -> int:
+        return self._mask
+
+
+class Reason(IntEnum):
+    FULL             = 0
+    SHIFT            = 1
+    PARALLEL_SESSION = 2
+    CLASSMATES       = 3
+    GROUPMATES       = 4
+    ATTENDING        = 5
+    GRADE_LEVEL      = 6
+    SUBJECT          = 7
+    CATEGORY         = 8
+    SECTIONS         = 9
+    CLOSED           = 10
+
+    def __str__(self) -> str:
+        return REASONS[self]
+
 
 class Rank:
+    __slots__ = ('_id', '_types', '_ordered', '_cursor', '_present', '_reason')
+
     def __init__(
         self,
         id   : str,
@@ -147,9 +212,10 @@ class Rank:
     ) -> None:
         self._id      = id
         self._types   = types
-        self._ordered = dict((type, list[Subject]()) for type in self.types)
-        self._present = dict((type, set[Subject]())  for type in self.types)
-        self._reason  = dict((type, list[str]())     for type in self.types)
+        self._ordered = None
+        self._cursor  = None
+        self._present = None
+        self._reason  = None
     
     def __repr__(self) -> str:
         return self.id
@@ -164,76 +230,143 @@ class Rank:
 
     @property
     def ordered(self) -> dict[str, list[Subject]]:
+        if self._ordered is None:
+            self._ordered = dict[str, list[Subject]]()
         return self._ordered
 
+    @property
+    def cursor(self) -> dict[str, int]:
+        if self._cursor is None:
+            self._cursor = dict[str, int]()
+        return self._cursor
+
     @property
     def present(self) -> dict[str, set[Subject]]:
+        if self._present is None:
+            self._present = dict[str, set[Subject]]()
         return self._present
 
     @property
-    def reason(self) -> dict[str, list[str]]:
+    def reason(self) -> dict[str, list[tuple[Subject, Reason]]]:
+        if self._reason is None:
+            self._reason = dict[str, list[tuple[Subject, Reason]]]()
         return self._reason
 
     def all(self, type: str) -> list[Subject]:
-        return self.ordered[type]
+        if type not in self._types:
+            raise Exception()
+        elif self._ordered is None or type not in self._ordered:
+            return list[Subject]()
+        else:
+            return self._ordered[type][self._cursor[type]:]
+
+    def count(self, type: str) -> int:
+        if type not in self._types:
+            raise Exception()
+        elif self._ordered is None or type not in self._ordered:
+            return 0
+        else:
+            return len(self._ordered[type]) - self._cursor[type]
 
     def get(
         self,
         type : str,
         index: int = None
     ) -> Subject:
-        return self.ordered[type][index or 0]
+        if type not in self._types:
+            raise Exception()
+        elif self._ordered is None or type not in self._ordered:
+            raise IndexError()
+        else:
+            return self._ordered[type][self._cursor[type] + (index or 0)]
+
+    def last(self, type: str) -> Reason:
+        return self.reason[type][-1][1]
+
+    def render(self, type: str) -> list[str]:
+        return [f'{subject}: {reason}' for subject, reason in self.reason.get(type, list())]
 
     def add(
         self,
         type   : str,
         subject: Subject
     ) -> None:
-        if subject in self.present[type]:
+        if type not in self._types:
+            raise Exception()
+        elif subject in self.present.get(type, EMPTY):
             # TODO: raise Exception()
             return
         else:
-            self._ordered[type].append(subject)
-            self._present[type].add(subject)
+            self.ordered.setdefault(type, list[Subject]()).append(subject)
+            self.cursor.setdefault(type, 0)
+            self.present.setdefault(type, set[Subject]()).add(subject)
 
     def reject(
         self,
         type  : str,
-        reason: str,
+        reason: Reason,
         index : int = None
     ) -> None:
-        subject = self.get(type, index)
-        self._ordered[type].pop(index or 0)
+        ordered = self.ordered[type]
+        cursor  = self._cursor[type]
+        subject = ordered[cursor + (index or 0)]
+        if index:
+            ordered[cursor + 1:cursor + index + 1] = ordered[cursor:cursor + index]
+            ordered[cursor] = subject
+        self._cursor[type] = cursor + 1
         self._present[type].remove(subject)
-        self._reason[type].append(f'{subject}: {reason}')
+        self.reason.setdefault(type, list()).append((subject, reason))
+
+    def restore(
+        self,
+        type   : str,
+        subject: Subject,
+        index  : int = None
+    ) -> None:
+        if not self.reason.get(type):
+            raise Exception()
+        ordered = self.ordered.setdefault(type, list[Subject]())
+        cursor  = self.cursor.setdefault(type, 0)
+        if cursor and ordered[cursor - 1] == subject:
+            cursor -= 1
+            ordered[cursor:cursor + (index or 0)] = ordered[cursor + 1:cursor + (index or 0) + 1]
+            ordered[cursor + (index or 0)] = subject
+        else:
+            ordered.insert(cursor + (index or 0), subject)
+        self.cursor[type] = cursor
+        self.present.setdefault(type, set[Subject]()).add(subject)
+        self.reason[type].pop()
 
     def clear(self, type: str = None) -> None:
         if type is None:
-            for key in self._ordered:
-                self._ordered[key].clear()
-                self._present[key].clear()
-        else:
-            self._ordered[type].clear()
-            self._present[type].clear()
+            self._ordered = None
+            self._cursor  = None
+            self._present = None
+        elif self._ordered is not None and type in self._ordered:
+            del self._ordered[type]
+            del self._cursor[type]
+            del self._present[type]
 
 
 class Rankings:
+    __slots__ = ('_id', '_to_rank', '_initial', '_final')
+
     def __init__(
         self,
         id     : str,
         to_rank: set[str]
     ) -> None:
-        self._id      = f'RANKING-{id}'
+        self._id      = id
         self._to_rank = to_rank
-        self._initial = Rank(f'{id}I', self.to_rank)
-        self._final   = Rank(f'{id}F', self.to_rank)
+        self._initial = None
+        self._final   = None
     
     def __repr__(self) -> str:
         return self.id
 
     @property
     def id(self) -> str:
-        return self._id
+        return f'RANKING-{self._id}'
 
     @property
     def to_rank(self) -> set[str]:
@@ -241,10 +374,14 @@ class Rankings:
 
     @property
     def initial(self) -> Rank:
+        if self._initial is None:
+            self._initial = Rank(f'{self._id}I', self.to_rank)
         return self._initial
 
     @property
     def final(self) -> Rank:
+        if self._final is None:
+            self._final = Rank(f'{self._id}F', self.to_rank)
         return self._final
 
     def add(
@@ -257,6 +394,8 @@ class Rankings:
 
 
 class GradeLevel:
+    __slots__ = ('_grade_level', '_to_rank', '_category_types', '_subject_types')
+
     def __init__(
         self,
         grade_level   : int,
@@ -292,8 +431,67 @@ class GradeLevel:
     def subject_types(self) -> set[str]:
         return self._subject_types
 
-    
+
+class History:
+    __slots__ = ('_grade_level', '_attends', '_attends_mask')
+
+    def __init__(
+        self,
+        grade_level: GradeLevel,
+        attends    : Iterable[Subject | Category]
+    ) -> None:
+        self._grade_level  = grade_level
+        self._attends      = frozenset(attends)
+        self._attends_mask = reduce(or_, (object.mask for object in self.attends), int())
+
+    def __repr__(self) -> str:
+        return f'{self.grade_level}: {sorted(map(str, self.attends))}'
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, History):
+            return NotImplemented
+        else:
+            return self.grade_level == other.grade_level and self.attends == other.attends
+
+    def __hash__(self) -> int:
+        return hash((self.grade_level, self.attends))
+
+    @property
+    def grade_level(self) -> GradeLevel:
+        return self._grade_level
+
+    @property
+    def attends(self) -> frozenset[Subject | Category]:
+        return self._attends
+
+    @property
+    def attends_mask(self) -> int:
+        return self._attends_mask
+
+
 class Student:
+    __slots__ = (
+        '_id',
+        '_grade_level',
+        '_shift',
+        '_prerequisites',
+        '_not_alongside',
+        '_previous',
+        '_index',
+        '_prerequisites_mask',
+        '_not_alongside_mask',
+        '_bitset',
+        '_attends',
+        '_attends_mask',
+        '_groups',
+        '_sections',
+        '_sessions',
+        '_occupied',
+        '_rankings',
+        '_categories',
+        '_subjects'
+    )
+
     def __init__(
         self,
         id           : str,
@@ -301,25 +499,36 @@ class Student:
         shift        : Shift        = None,
         prerequisites: set[Student] = None,
         not_alongside: set[Student] = None,
-        previous     : Student      = None
+        previous     : History      = None,
+        index        : int          = None
     ) -> None:
         self._id             = id
         self._grade_level    = grade_level
         self._shift          = shift
-        self._prerequisites  = prerequisites or set()
-        self._not_alongside  = not_alongside or set()
+        self._prerequisites  = prerequisites or None
+        self._not_alongside  = not_alongside or None
         self._previous       = previous
+        self._index          = index
 
-        self._attends    = set[Subject | Category]()
-        self._groups     = dict[Subject | Category, Group]()
-        self._sections   = dict[Subject | Category, Section]()
-        self._sessions   = dict[str, Section | None]()
-        self._rankings   = Rankings(self.id, self.grade_level.to_rank)
-        self._categories = dict[str, Category | None](
+        self._prerequisites_mask = reduce(or_, (student.mask for student in self.prerequisites), int())
+        self._not_alongside_mask = reduce(or_, (student.mask for student in self.not_alongside), int())
+        self._bitset             = all(
+            student.index is not None
+                for student in self.prerequisites | self.not_alongside
+        )
+
+        self._attends      = set[Subject | Category]()
+        self._attends_mask = int()
+        self._groups       = None
+        self._sections     = dict[Subject | Category, Section]()
+        self._sessions     = dict[str, Section | None]()
+        self._occupied     = int()
+        self._rankings     = Rankings(self.id, self.grade_level.to_rank)
+        self._categories   = dict[str, Category | None](
             (type, None) 
                 for type in self.grade_level.category_types
         )
-        self._subjects   = dict[str, Subject | None](
+        self._subjects     = dict[str, Subject | None](
             (type, None)
                 for type in self.grade_level.subject_types
         )
@@ -341,31 +550,64 @@ class Student:
 
     @property
     def prerequisites(self) -> set[Student]:
-        return self._prerequisites
+        return self._prerequisites or EMPTY
 
     @property
     def not_alongside(self) -> set[Student]:
-        return self._not_alongside
+        return self._not_alongside or EMPTY
 
     @property
-    def previous(self) -> Student | None:
+    def previous(self) -> History | None:
         return self._previous
 
     @previous.setter
-    def previous(self, student: Student) -> None:
-        if student.grade_level.grade_level >= self.grade_level.grade_level:
+    def previous(self, history: History) -> None:
+        if history.grade_level.grade_level >= self.grade_level.grade_level:
             raise Exception()
         else:
-            self._previous = student
+            self._previous = history
+
+    @property
+    def index(self) -> int | None:
+        return self._index
+
+    @property
+    def mask(self) -> int:
+        if self.index is None:
+            return int()
+        else:
+            return 1 << self.index
+
+    @property
+    def prerequisites_mask(self) -> int:
+        return self._prerequisites_mask
+
+    @property
+    def not_alongside_mask(self) -> int:
+        return self._not_alongside_mask
+
+    @property
+    def bitset(self) -> bool:
+        return self._bitset
 
     @property
     def attends(self) -> set[Subject | Category]:
         return self._attends
 
+    @property
+    def attends_mask(self) -> int:
+        return self._attends_mask
+
     @property
     def groups(self) -> dict[Subject | Category, Group]:
+        if self._groups is None:
+            self._groups = dict[Subject | Category, Group]()
         return self._groups
 
+    @property
+    def memberships(self) -> Iterable[Group]:
+        return self._groups.values() if self._groups else EMPTY
+
     @property
     def sections(self) -> dict[Subject | Category, Group]:
         return self._sections
@@ -374,6 +616,10 @@ class Student:
     def sessions(self) -> dict[str, Section | None]:
         return self._sessions
 
+    @property
+    def occupied(self) -> int:
+        return self._occupied
+
     @property
     def rankings(self) -> Rankings:
         return self._rankings
@@ -387,37 +633,66 @@ class Student:
         return self._subjects
 
     @property
-    def taken(self) -> set[Subject | Category] | None:
-        if isinstance(self.previous, Student):
+    def taken(self) -> frozenset[Subject | Category]:
+        if isinstance(self.previous, History):
             return self.previous.attends
+        else:
+            return EMPTY
+
+    @property
+    def taken_mask(self) -> int:
+        if isinstance(self.previous, History):
+            return self.previous.attends_mask
+        else:
+            return int()
+
+    def attend(self, object: Subject | Category) -> None:
+        self.attends.add(object)
+        self._attends_mask |= object.mask
 
     def add_subject(
         self,
-        type   : str,
-        subject: Subject
-    ) -> None:
+        type    : str,
+        subject : Subject,
+        sections: list[Section] = None
+    ) -> tuple[bool, Reason | None]:
         if type not in self.grade_level.subject_types:
             raise Exception()
         elif self.subjects[type] is not None:
             raise Exception()
-        elif subject.add_student(self)[0]:
+        qualified, reason = subject.add_student(self, sections)
+        if qualified:
             self.subjects[type] = subject
-            self.add_section(subject)
-            self.attends.add(subject)
+            self.attend(subject)
+        return qualified, reason
 
     def add_category(
         self,
         type    : str,
-        category: Category
-    ) -> None:
+        category: Category,
+        sections: list[Section] = None
+    ) -> tuple[bool, Reason | None]:
         if type not in self.grade_level.category_types:
             raise Exception()
         elif self.categories[type] is not None:
             raise Exception()
-        elif category.add_student(self)[0]:
+        qualified, reason = category.add_student(self, sections)
+        if qualified:
             self.categories[type] = category
-            self.add_section(category)
-            self.attends.add(category)
+            self.attend(category)
+        return qualified, reason
+
+    def assign(
+        self,
+        type  : str,
+        object: Subject | Category
+    ) -> None:
+        types = self.subjects if isinstance(object, Subject) else self.categories
+        if types.get(type, object) is not None:
+            raise Exception()
+        else:
+            types[type] = object
+            self.attend(object)
 
     def add_section(
         self,
@@ -425,27 +700,54 @@ class Student:
         section: Section = None
     ) -> None:
         if section is not None:
-            if parent not in self.attends:
+            if section.parent != parent:
                 raise Exception()
             elif self.shift not in {None, section.shift}:
                 raise Exception()
-            elif not self.ok_groupmates(section):
-                raise Exception()
-            elif not self.ok_classmates(section):
-                raise Exception()
-            elif section.add_student[0]:
+            else:
                 self.sections[parent] = section
                 self.sessions[section.parallel_session.partition] = section
+                self._occupied |= section.parallel_session.mask
         else:
             self.sections[parent] = section
 
+    def remove_section(self, parent: Subject | Category) -> Section | None:
+        if parent not in self.sections:
+            raise Exception()
+        section = self.sections.pop(parent)
+        if section is not None:
+            self.sessions.pop(section.parallel_session.partition, None)
+            self._occupied &= ~section.parallel_session.mask
+        return section
+
+    def free(self, session: ParallelSession) -> bool:
+        if session.mask:
+            return not self._occupied & session.mask
+        else:
+            return self.sessions.get(session.partition) is None
+
+    def drop(self, object: Subject | Category) -> str:
+        for types in (self.subjects, self.categories):
+            for type, object_ in types.items():
+                if object_ == object:
+                    types[type] = None
+                    self.attends.discard(object)
+                    self._attends_mask &= ~object.mask
+                    object.remove_student(self)
+                    return type
+        raise Exception()
+
     def add_prerequisite(self, student: Student) -> None:
         if student == self:
             raise Exception()
         elif student in self.not_alongside:
             raise Exception()
         else:
-            self.prerequisites.add(student)
+            if self._prerequisites is None:
+                self._prerequisites = set[Student]()
+            self._prerequisites.add(student)
+            self._prerequisites_mask |= student.mask
+            self._bitset             &= student.index is not None
 
     def add_not_alongside(self, student: Student) -> None:
         if student == self:
@@ -453,7 +755,11 @@ class Student:
         elif student in self.prerequisites:
             raise Exception()
         else:
-            self.not_alongside.add(student)
+            if self._not_alongside is None:
+                self._not_alongside = set[Student]()
+            self._not_alongside.add(student)
+            self._not_alongside_mask |= student.mask
+            self._bitset             &= student.index is not None
 
     def add_group(
         self,
@@ -482,17 +788,48 @@ class Student:
                     return True
         return False
 
-    def propose(
+    def block(
         self,
         type : str,
         index: int = 0
-    ) -> None:
-        subject           = self.rankings.final.get(type, index)
-        qualified, reason = subject.add_student(self)
+    ) -> list[tuple[Student, str]]:
+        if self._groups is None:
+            return list()
+        subject = self.rankings.final.get(type, index)
+        group   = self._groups.get(subject)
+        if group is None or not group.required or group.section is not None or not subject.sections:
+            return list()
+        block = list[tuple[Student, str]]()
+        for groupmate in sorted(group.students, key=str):
+            if groupmate == self:
+                continue
+            for type_ in sorted(groupmate.grade_level.to_rank):
+                if groupmate.subjects.get(type_) is not None or groupmate.categories.get(type_) is not None:
+                    continue
+                elif groupmate.rankings.final.count(type_) and groupmate.rankings.final.get(type_) == subject:
+                    block.append((groupmate, type_))
+                    break
+        return block
+
+    def propose(
+        self,
+        type    : str,
+        index   : int           = 0,
+        sections: list[Section] = None
+    ) -> bool:
+        subject = self.rankings.final.get(type, index)
+        block   = self.block(type, index) if sections is None else list()
+        if block:
+            qualified, reason = subject.add_block([(self, type)] + block)
+        elif isinstance(subject, Subject):
+            qualified, reason = self.add_subject(type, subject, sections)
+        else:
+            qualified, reason = self.add_category(type, subject, sections)
         if not qualified:
             self.rankings.final.reject(type, reason, index)
-        else:
-            self.add_subject(type, subject)
+            for groupmate, type_ in block:
+                groupmate.rankings.final.reject(type_, reason)
+        return qualified
 
     def default_ranking(
         self,
@@ -503,32 +840,48 @@ class Student:
         for subject in subjects:
             self.rankings.final.add(type, subject)
 
+    def group(self, object: Subject | Category) -> Group | None:
+        if self._groups is None:
+            return None
+        return self._groups.get(object)
+
     def ok_groupmates(self, section: Section) -> bool:
-        for object, group in self.groups.items():
-            if group.required:
-                if object == section.parent:
-                    for groupmate in group.students:
-                        if groupmate.sections[object] not in {None, section}:
-                            return False
-                else:
-                    return False
-                if any(
-                    groupmate.shift not in {None, section.shift}
-                        for groupmate in group.students
-                ):
-                    return False
-        return True
+        if self._groups is None:
+            return True
+        group = self._groups.get(section.parent)
+        if group is None or not group.required:
+            return True
+        elif group.section not in {None, section}:
+            return False
+        else:
+            return group.shift in {None, section.shift}
 
     def ok_classmates(self, object: Section | Group) -> bool:
-        if not object.students.issuperset(self.prerequisites):
+        return self.ok_company(object.mask, object.students)
+
+    def ok_company(
+        self,
+        mask    : int,
+        students: set[Student]
+    ) -> bool:
+        if self.bitset:
+            if mask & self.prerequisites_mask != self.prerequisites_mask:
+                return False
+            elif mask & self.not_alongside_mask:
+                return False
+            else:
+                return True
+        elif not students.issuperset(self.prerequisites):
             return False
-        elif object.students.intersection(self.not_alongside):
+        elif students.intersection(self.not_alongside):
             return False
         else:
             return True
 
 
 class Group:
+    __slots__ = ('_id', '_parent', '_required', '_students', '_mask', '_capacity', '_shift', '_section')
+
     def __init__(
         self,
         id      : str,
@@ -540,8 +893,11 @@ class Group:
         self._parent   = parent
         self._required = required or bool()
         self._students = students or set()
+        self._mask     = reduce(or_, (student.mask for student in self.students), int())
 
         self._capacity = Capacity(0, 0, self.parent.max_group_members, len(self.students))
+        self._shift    = next((student.shift for student in self.students if student.shift is not None), None)
+        self._section  = None
     
     def __repr__(self) -> str:
         return self.id
@@ -562,10 +918,29 @@ class Group:
     def students(self) -> set[Student]:
         return self._students
 
+    @property
+    def mask(self) -> int:
+        return self._mask
+
     @property
     def capacity(self) -> Capacity:
         return self._capacity
 
+    @property
+    def shift(self) -> Shift | None:
+        return self._shift
+
+    @property
+    def section(self) -> Section | None:
+        return self._section
+
+    @section.setter
+    def section(self, value: Section | None) -> None:
+        if value is not None and value.parent != self.parent:
+            raise Exception()
+        else:
+            self._section = value
+
     def add_student(self, student: Student) -> None:
         if student in self.students:
             raise Exception()
@@ -575,12 +950,26 @@ class Group:
             raise Exception()
         else:
             self.students.add(student)
+            self._mask           |= student.mask
             self.capacity.filled += 1
             
             student.add_group(self.parent, self)
+            if student.shift is not None:
+                self._shift = student.shift
 
 
 class Section:
+    __slots__ = (
+        '_name',
+        '_parent',
+        '_shift',
+        '_parallel_session',
+        '_capacity',
+        '_students',
+        '_mask',
+        '_index'
+    )
+
     def __init__(
         self,
         parent          : Subject | Category,
@@ -588,18 +977,27 @@ class Section:
         parallel_session: ParallelSession,
         capacity        : Capacity,
         name            : str          = None,
-        students        : set[Student] = None
+        students        : set[Student] = None,
+        index           : int          = None
     ) -> None:
         self._name             = name
         self._parent           = parent
         self._shift            = shift
         self._parallel_session = parallel_session
         self._capacity         = capacity
-        self._students         = students
+        self._students         = students or set()
+        self._mask             = reduce(or_, (student.mask for student in self.students), int())
+        self._index            = index
     
     def __repr__(self) -> str:
         return self.name
 
+    def __hash__(self) -> int:
+        if self.index is None:
+            return super(Section, self).__hash__()
+        else:
+            return self.index
+
     @property
     def name(self) -> str:
         if self._name is None:
@@ -627,28 +1025,81 @@ class Section:
     def students(self) -> set[Student]:
         return self._students
 
-    def add_student(self, student: Student) -> tuple[bool, str | None]:
+    @property
+    def mask(self) -> int:
+        return self._mask
+
+    @property
+    def index(self) -> int | None:
+        return self._index
+
+    def screen(self, student: Student) -> Reason | None:
         if self.capacity.available <= 0:
-            return False, 'Full'
+            return Reason.FULL
         elif student.shift not in {None, self.shift}:
-            return False, 'Incompatible shift'
-        elif student.sessions[self.parallel_session.partition] is not None:
-            return False, 'Already attending a parallel session'
+            return Reason.SHIFT
+        elif not student.free(self.parallel_session):
+            return Reason.PARALLEL_SESSION
         elif not student.ok_classmates(self):
-            return False, 'Incompatible classmate/s'
+            return Reason.CLASSMATES
         elif not student.ok_groupmates(self):
-            return False, 'Incompatible with groupmate/s'
+            return Reason.GROUPMATES
         else:
-            self.students.add(student)
-            self.capacity += 1
-            try:
-                student.add_section(self.parent, self)
-                return True, None
-            except Exception:
-                ...
+            return None
+
+    def add_student(self, student: Student) -> tuple[bool, Reason | None]:
+        reason = self.screen(student)
+        if reason is not None:
+            return False, reason
+        else:
+            self.seat(student)
+            return True, None
+
+    def seat(self, student: Student) -> None:
+        student.add_section(self.parent, self)
+        self.students.add(student)
+        self._mask           |= student.mask
+        self.capacity.filled += 1
+        group = student.group(self.parent)
+        if group is not None and group.required:
+            group.section = self
+
+    def remove_student(self, student: Student) -> None:
+        if student not in self.students:
+            raise Exception()
+        else:
+            self.students.remove(student)
+            self._mask           &= ~student.mask
+            self.capacity.filled -= 1
+            student.remove_section(self.parent)
+            group = student.group(self.parent)
+            if group is not None and group.section is self and not self.students & group.students:
+                group.section = None
 
 
 class Category:
+    __slots__ = (
+        '_name',
+        '_types',
+        '_capacity',
+        '_sections',
+        '_prerequisites',
+        '_not_alongside',
+        '_max_group_members',
+        '_teaches',
+        '_students',
+        '_index',
+        '_clauses',
+        '_excludes',
+        '_verdicts',
+        '_order',
+        '_positions',
+        '_stamps',
+        '_heaps',
+        '_partitions',
+        '_sessions'
+    )
+
     def __init__(
         self,
         name             : str,
@@ -659,7 +1110,8 @@ class Category:
         not_alongside    : set[Subject | Category] = None,
         max_group_members: int                     = None,
         teaches          : set[GradeLevel]         = None,
-        students         : set[Student]            = None
+        students         : set[Student]            = None,
+        index            : int                     = None
     ) -> None:
         self._name              = name
         self._types             = types or set()
@@ -670,6 +1122,21 @@ class Category:
         self._max_group_members = max_group_members or int()
         self._teaches           = teaches or set()
         self._students          = students or set()
+        self._index             = index
+
+        self._clauses  = None
+        self._excludes = None
+        self._verdicts = dict[int, bool]()
+
+        self._order     = list[Section]()
+        self._positions = dict[Section, int]()
+        self._stamps    = list[int | None]()
+        self._heaps     = dict[str, list[tuple[int, int, int]]]()
+
+        self._partitions = dict[str, list[Section]]()
+        self._sessions   = dict[str, ParallelSession]()
+        for section in self.sections:
+            self.track(section)
     
     def __repr__(self) -> str:
         return self.name
@@ -710,6 +1177,32 @@ class Category:
     def students(self) -> set[Student]:
         return self._students
 
+    @property
+    def index(self) -> int | None:
+        return self._index
+
+    @index.setter
+    def index(self, value: int) -> None:
+        if self._index is not None:
+            raise Exception()
+        else:
+            self._index = value
+
+    @property
+    def mask(self) -> int:
+        if self.index is None:
+            return int()
+        else:
+            return 1 << self.index
+
+    @property
+    def compiled(self) -> bool:
+        return self._clauses is not None
+
+    @property
+    def closed(self) -> bool:
+        return not self.sections and bool(self._order)
+
     def add_section(self, section: Section) -> None:
         if section.parent != self:
             raise Exception()
@@ -718,6 +1211,100 @@ class Category:
         else:
             self.sections.add(section)
             self.capacity.increase(section.capacity)
+            self.track(section)
+
+    def close(self, section: Section) -> list[Student]:
+        if section not in self.sections:
+            raise Exception()
+        displaced = sorted(section.students, key=str)
+        for student in displaced:
+            section.remove_student(student)
+        self.sections.remove(section)
+        self.capacity.decrease(section.capacity)
+        self._stamps[self._positions[section]] = None
+        self._partitions[section.parallel_session.partition].remove(section)
+        return displaced
+
+    def remove_student(self, student: Student) -> None:
+        if student not in self.students:
+            raise Exception()
+        else:
+            self.students.remove(student)
+            self.capacity.filled -= 1
+            if self not in student.sections:
+                return
+            section = student.sections[self]
+            if section is None:
+                student.remove_section(self)
+            else:
+                section.remove_student(student)
+                if section in self.sections:
+                    self.refresh(section)
+
+    def track(self, section: Section) -> None:
+        self._positions[section] = len(self._order)
+        self._order.append(section)
+        self._stamps.append(None)
+        self._partitions.setdefault(section.parallel_session.partition, list()).append(section)
+        self._sessions.setdefault(section.parallel_session.partition, section.parallel_session)
+        self.refresh(section)
+
+    def fitting(self, student: Student) -> list[Section]:
+        return [
+            section
+                for partition, sections in self._partitions.items()
+                if student.free(self._sessions[partition])
+                for section in sections
+                if section.capacity.available > 0
+                and student.shift in {None, section.shift}
+        ]
+
+    def refresh(self, section: Section) -> None:
+        position = self._positions[section]
+        filled   = section.capacity.filled
+        if section.capacity.available > 0:
+            self._stamps[position] = filled
+            heappush(
+                self._heaps.setdefault(section.parallel_session.partition, list()),
+                (filled - section.capacity.ideal, position, filled)
+            )
+        else:
+            self._stamps[position] = None
+
+    def select(self, student: Student) -> Section | None:
+        heaps   = [
+            heap
+                for partition, heap in self._heaps.items()
+                if student.free(self._sessions[partition])
+        ]
+        tried   = list[tuple[list[tuple[int, int, int]], tuple[int, int, int]]]()
+        section = None
+        while section is None:
+            best = None
+            for heap in heaps:
+                while heap:
+                    distance, position, stamp = heap[0]
+                    if stamp != self._stamps[position]:
+                        heappop(heap)
+                    elif stamp != self._order[position].capacity.filled:
+                        heappop(heap)
+                        self.refresh(self._order[position])
+                    else:
+                        break
+                if heap and (best is None or heap[0] < best[0]):
+                    best = heap[0], heap
+            if best is None:
+                break
+            entry, heap = best
+            tried.append((heap, heappop(heap)))
+            qualified, reason = self._order[entry[1]].add_student(student)
+            if qualified:
+                section = self._order[entry[1]]
+        for heap, entry in tried:
+            heappush(heap, entry)
+        if section is not None:
+            self.refresh(section)
+        return section
 
     def add_prerequisites(self, objects: tuple[Subject | Category]) -> None:
         if self in objects:
@@ -726,47 +1313,171 @@ class Category:
             raise Exception()
         else:
             self.prerequisites.add(objects)
+            self._clauses = None
 
     def add_not_alongside(self, object: Subject | Category) -> None:
         if self == object:
             raise Exception()
         else:
             self.not_alongside.add(object)
+            self._clauses = None
 
-    def add_student(self, student: Student) -> tuple[bool, str | None]:
-        if self.capacity.available <= 0:
-            return False, 'Full'
+    def compile(self) -> None:
+        self._clauses  = None
+        self._excludes = None
+        self._verdicts = dict[int, bool]()
+        if any(
+            object.index is None
+                for object in self.not_alongside.union(*self.prerequisites)
+        ):
+            return
+        self._clauses  = [
+            reduce(or_, (object.mask for object in prerequisites), int())
+                for prerequisites in self.prerequisites
+        ]
+        self._excludes = reduce(or_, (object.mask for object in self.not_alongside), int())
+
+    def screen(self, student: Student) -> Reason | None:
+        if student in self.students:
+            return Reason.ATTENDING
+        elif self.capacity.available <= 0:
+            return Reason.FULL
         elif not self.ok_student(student):
-            return False, 'Incompatible with category'
+            return Reason.CATEGORY
+        else:
+            return None
+
+    def add_student(
+        self,
+        student : Student,
+        sections: list[Section] = None
+    ) -> tuple[bool, Reason | None]:
+        reason = self.screen(student)
+        if reason is not None:
+            return False, reason
+        else:
+            return self.add_to_section(student, sections)
+
+    def add_block(self, block: list[tuple[Student, str]]) -> tuple[bool, Reason | None]:
+        students = [student for student, type in block]
+        mask     = reduce(or_, (student.mask for student in students), int())
+        bitset   = all(student.bitset for student in students)
+        for student in students:
+            reason = self.screen(student)
+            if reason is not None:
+                return False, reason
+        if self.capacity.available < len(students):
+            return False, Reason.FULL
+        candidates = sorted(
+            (
+                (section.capacity.filled - section.capacity.ideal, self._positions[section], section)
+                    for section in self.fitting(students[0])
+                    if section.capacity.available >= len(students)
+                    and all(
+                        student.shift in {None, section.shift}
+                        and student.free(section.parallel_session)
+                        and student.ok_groupmates(section)
+                            for student in students
+                    )
+            ),
+            key=lambda candidate: candidate[:2]
+        )
+        for distance, position, section in candidates:
+            company = section.students if bitset else section.students.union(students)
+            if all(student.ok_company(section.mask | mask, company) for student in students):
+                break
+        else:
+            return False, Reason.SECTIONS
+        self.seat_block(block, section)
+        return True, None
+
+    def seat_block(
+        self,
+        block  : list[tuple[Student, str]],
+        section: Section
+    ) -> None:
+        if section not in self.sections:
+            raise Exception()
+        elif section.capacity.available < len(block):
+            raise Exception()
+        for student, type in block:
+            section.seat(student)
+        self.refresh(section)
+        self.students.update(student for student, type in block)
+        self.capacity.filled += len(block)
+        for student, type in block:
+            student.assign(type, self)
+
+    def admit(self, students: list[Student]) -> int:
+        count = min(len(students), max(self.capacity.available, 0))
+        if not count or self.closed:
+            return int()
         elif self.sections:
-            for section in self.sections:
+            student = students[0]
+            heap    = [
+                (section.capacity.filled - section.capacity.ideal, self._positions[section], section)
+                    for section in self.fitting(student)
+                    if student.ok_classmates(section)
+                    and student.ok_groupmates(section)
+            ]
+            heapify(heap)
+            seated = set[Section]()
+            placed = 0
+            while placed < count and heap:
+                distance, position, section = heappop(heap)
+                section.seat(students[placed])
+                seated.add(section)
+                placed += 1
+                if section.capacity.available > 0:
+                    heappush(heap, (distance + 1, position, section))
+            for section in seated:
+                self.refresh(section)
+            count = placed
+        else:
+            for student in students[:count]:
+                student.add_section(self)
+        self.students.update(students[:count])
+        self.capacity.filled += count
+        return count
+
+    def add_to_section(
+        self,
+        student : Student,
+        sections: list[Section] = None
+    ) -> tuple[bool, Reason | None]:
+        if self.closed:
+            return False, Reason.CLOSED
+        elif not self.sections:
+            student.add_section(self)
+        elif sections is not None:
+            for section in sections:
                 qualified, reason = section.add_student(student)
                 if qualified:
-                    self.students.add(student)
-                    self.capacity.filled += 1
-                    try:
-                        student.add_category(self.types, self)
-                        return True, None
-                    except Exception:
-                        ...
-            return False, 'Incompatible with sections'
-        else:
-            self.students.add(student)
-            self.capacity.filled += 1
-            try:
-                student.add_category(self.types, self)
-                return True, None
-            except Exception:
-                ...
+                    self.refresh(section)
+                    break
+            else:
+                return False, Reason.SECTIONS
+        elif self.select(student) is None:
+            return False, Reason.SECTIONS
+        self.students.add(student)
+        self.capacity.filled += 1
+        return True, None
 
     def ok_student(self, student: Student) -> bool:
+        if self.compiled:
+            taken = student.taken_mask
+            if taken not in self._verdicts:
+                self._verdicts[taken] = all(taken & clause for clause in self._clauses)
+            return self._verdicts[taken] and not student.attends_mask & self._excludes
         for prerequisites in self.prerequisites:
-            if not student.taken.intersection(set(prerequisites)):
+            if not student.taken.intersection(prerequisites):
                 return False
-        return len(student.attends.intersection(self.not_alongside)) > 0
+        return not student.attends.intersection(self.not_alongside)
 
 
 class Subject(Category):
+    __slots__ = ('_level', '_repeatable')
+
     def __init__(
         self,
         name             : str,
@@ -779,7 +1490,8 @@ class Subject(Category):
         not_alongside    : set[Subject | Category] = None,
         max_group_members: int                     = None,
         teaches          : set[GradeLevel]         = None,
-        students         : set[Student]            = None
+        students         : set[Student]            = None,
+        index            : int                     = None
     ) -> None:
         super(Subject, self).__init__(
             name,
@@ -790,7 +1502,8 @@ class Subject(Category):
             not_alongside,
             max_group_members,
             teaches,
-            students
+            students,
+            index
         )
 
         self._level      = level
@@ -812,22 +1525,14 @@ class Subject(Category):
     def repeatable(self) -> bool:
         return self._repeatable
 
-    def add_student(self, student: Student) -> tuple[bool, str | None]:
-        if self.capacity.available <= 0:
-            return False, 'Full'
+    def screen(self, student: Student) -> Reason | None:
+        if student in self.students:
+            return Reason.ATTENDING
+        elif self.capacity.available <= 0:
+            return Reason.FULL
         elif student.grade_level not in self.teaches:
-            return False, 'Grade level incompatible'
+            return Reason.GRADE_LEVEL
         elif not self.ok_student(student):
-            return False, 'Incompatible with subject'
+            return Reason.SUBJECT
         else:
-            for section in self.sections:
-                qualified, reason = section.add_student(student)
-                if qualified:
-                    self.students.add(student)
-                    self.capacity.filled += 1
-                    try:
-                        student.add_subject(self.types, self)
-                        return True, None
-                    except Exception:
-                        ...
-            return False, 'Incompatible with sections'
\ No newline at end of file
+            return None
\ No newline at end of file
@@ -0,0 +1,5 @@
+PAIRS = 10
+
+ANALYSIS_TEMPLATE = 'Analysis: {} rankings from {} students over {} subjects, {} oversubscribed ({:.3f}s)'
+OBJECT_TEMPLATE   = '{}: {} first choice, {:.2f} weighted, {} seats ({:.0%})'
+PAIR_TEMPLATE     = '{} + {}: {} students, {} first choices, {:.2f} weighted'
\ No newline at end of file
@@ -0,0 +1,240 @@
+from src.gnt.analyze.constants import *
+
+from src.cls.main        import Student
+from src.cls.main        import Section
+from src.cls.main        import Subject
+from src.cls.main        import Category
+from src.gnt.encode.main import EncodeAgent
+from numpy               import ndarray
+from numpy               import array
+from numpy               import arange
+from numpy               import repeat
+from numpy               import cumsum
+from numpy               import bincount
+from numpy               import divide
+from numpy               import where
+from numpy               import zeros
+from numpy               import triu_indices
+from numpy               import argsort
+from numpy               import unique
+from numpy               import inf
+from numpy               import int32
+from numpy               import float32
+from numpy               import float64
+from operator            import attrgetter
+from time                import perf_counter
+from typing              import Iterable
+
+
+class Analysis:
+    def __init__(
+        self,
+        objects   : list[Subject | Category],
+        types     : list[str],
+        students  : ndarray,
+        type      : ndarray,
+        ranks     : ndarray,
+        subjects  : ndarray,
+        demand    : ndarray,
+        weighted  : ndarray,
+        capacity  : ndarray,
+        coranked  : ndarray,
+        cofirst   : ndarray,
+        coweighted: ndarray,
+        elapsed   : float = None
+    ) -> None:
+        self._objects    = objects
+        self._types      = types
+        self._students   = students
+        self._type       = type
+        self._ranks      = ranks
+        self._subjects   = subjects
+        self._demand     = demand
+        self._weighted   = weighted
+        self._capacity   = capacity
+        self._coranked   = coranked
+        self._cofirst    = cofirst
+        self._coweighted = coweighted
+        self._elapsed    = elapsed or float()
+
+    def __repr__(self) -> str:
+        return ANALYSIS_TEMPLATE.format(
+            len(self.subjects),
+            len(unique(self.students)),
+            len(self.objects),
+            int((self.pressure > 1).sum()),
+            self.elapsed
+        )
+
+    @property
+    def objects(self) -> list[Subject | Category]:
+        return self._objects
+
+    @property
+    def types(self) -> list[str]:
+        return self._types
+
+    @property
+    def students(self) -> ndarray:
+        return self._students
+
+    @property
+    def type(self) -> ndarray:
+        return self._type
+
+    @property
+    def ranks(self) -> ndarray:
+        return self._ranks
+
+    @property
+    def subjects(self) -> ndarray:
+        return self._subjects
+
+    @property
+    def capacity(self) -> ndarray:
+        return self._capacity
+
+    @property
+    def elapsed(self) -> float:
+        return self._elapsed
+
+    @property
+    def demand(self) -> ndarray:
+        return self._demand
+
+    @property
+    def weighted(self) -> ndarray:
+        return self._weighted
+
+    @property
+    def pressure(self) -> ndarray:
+        return divide(
+            self.weighted,
+            self.capacity,
+            out=where(self.weighted > 0, inf, float()),
+            where=self.capacity > 0
+        )
+
+    @property
+    def coranked(self) -> ndarray:
+        return self._coranked
+
+    @property
+    def cofirst(self) -> ndarray:
+        return self._cofirst
+
+    @property
+    def coweighted(self) -> ndarray:
+        return self._coweighted
+
+    def rows(self) -> list[str]:
+        return [
+            OBJECT_TEMPLATE.format(
+                self.objects[index],
+                self.demand[index],
+                self.weighted[index],
+                int(self.capacity[index]),
+                self.pressure[index]
+            )
+                for index in argsort(-self.pressure, kind='stable').tolist()
+                if self.weighted[index]
+        ]
+
+    def pairs(self, count: int = None) -> list[str]:
+        left, right = triu_indices(len(self.objects), 1)
+        shared      = self.coranked[left, right]
+        order       = argsort(-shared, kind='stable')[:count or PAIRS]
+        return [
+            PAIR_TEMPLATE.format(
+                self.objects[left[index]],
+                self.objects[right[index]],
+                shared[index],
+                self.cofirst[left[index], right[index]],
+                self.coweighted[left[index], right[index]]
+            )
+                for index in order.tolist()
+                if shared[index]
+        ]
+
+
+class AnalyzeAgent:
+    def extract(
+        self,
+        students: Iterable[Student]
+    ) -> tuple[list[str], ndarray, ndarray, ndarray, ndarray]:
+        index    = attrgetter('index')
+        codes    = dict[str, int]()
+        owners   = list[int]()
+        kinds    = list[int]()
+        lengths  = list[int]()
+        subjects = list[int]()
+        for row, student in enumerate(students):
+            initial = student.rankings.initial
+            for type in sorted(student.grade_level.to_rank):
+                ranked = initial.all(type)
+                subjects.extend(map(index, ranked))
+                owners.append(row)
+                kinds.append(codes.setdefault(type, len(codes)))
+                lengths.append(len(ranked))
+        lengths = array(lengths, dtype=int32).reshape(-1)
+        offsets = cumsum(lengths) - lengths
+        return (
+            list(codes),
+            repeat(array(owners, dtype=int32), lengths),
+            repeat(array(kinds, dtype=int32), lengths),
+            arange(int(lengths.sum()), dtype=int32) - repeat(offsets, lengths).astype(int32),
+            array(subjects, dtype=int32).reshape(-1)
+        )
+
+    def capacity(
+        self,
+        objects : list[Subject | Category],
+        sections: Iterable[Section]
+    ) -> ndarray:
+        parents  = list[int]()
+        maximums = list[int]()
+        for section in sections:
+            parents.append(section.parent.index)
+            maximums.append(section.capacity.maximum)
+        return bincount(
+            array(parents, dtype=int32).reshape(-1),
+            weights=array(maximums, dtype=float64).reshape(-1),
+            minlength=len(objects)
+        )
+
+    def comatrix(
+        self,
+        shape   : tuple[int, int],
+        students: ndarray,
+        subjects: ndarray,
+        values  : ndarray | float
+    ) -> ndarray:
+        incidence = zeros(shape, dtype=float32)
+        incidence[students, subjects] = values
+        return incidence.T @ incidence
+
+    def analyze(self, encode_agent: EncodeAgent) -> Analysis:
+        start   = perf_counter()
+        objects = encode_agent.catalog
+        shape   = (len(encode_agent.roster), len(objects))
+        types, students, type, ranks, subjects = self.extract(encode_agent.roster)
+        first   = ranks == 0
+        weights = 1 / (ranks + 1)
+        return Analysis(
+            objects=objects,
+            types=types,
+            students=students,
+            type=type,
+            ranks=ranks,
+            subjects=subjects,
+            demand=bincount(subjects[first], minlength=len(objects)),
+            weighted=bincount(subjects, weights=weights, minlength=len(objects)),
+            capacity=self.capacity(objects, encode_agent.sections),
+            coranked=self.comatrix(shape, students, subjects, 1).round().astype(int32),
+            cofirst=self.comatrix(shape, students[first], subjects[first], 1).round().astype(int32),
+            coweighted=self.comatrix(shape, students, subjects, weights),
+            elapsed=perf_counter() - start
+        )
+
+
+analyze_agent = AnalyzeAgent()
@@ -0,0 +1,3 @@
+COPIES = 50
+
+MEMORY_TEMPLATE = '{} students: {:.0f} bytes/student ({:.1f} MiB)'
@@ -0,0 +1,91 @@
+from src.gnt.bench.constants import *
+
+from src.cls.main        import Student
+from src.gnt.encode.main import EncodeAgent
+from gc                  import collect
+from tracemalloc         import start
+from tracemalloc         import stop
+from tracemalloc         import get_traced_memory
+from tracemalloc         import is_tracing
+
+
+class Memory:
+    def __init__(
+        self,
+        students: int,
+        size    : int
+    ) -> None:
+        self._students = students
+        self._size     = size
+
+    def __repr__(self) -> str:
+        return MEMORY_TEMPLATE.format(
+            self.students,
+            self.per_student,
+            self.size / 2 ** 20
+        )
+
+    @property
+    def students(self) -> int:
+        return self._students
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def per_student(self) -> float:
+        return self.size / self.students if self.students else float()
+
+
+class BenchAgent:
+    def clone(
+        self,
+        student: Student,
+        id     : str,
+        index  : int
+    ) -> Student:
+        clone = Student(id=id, grade_level=student.grade_level, index=index)
+        for type in sorted(student.grade_level.to_rank):
+            for subject in student.rankings.initial.all(type):
+                clone.rankings.add(type, subject)
+        if student.previous is not None:
+            clone.previous = student.previous
+        return clone
+
+    def memory(
+        self,
+        subject_path: str,
+        student_path: str,
+        copies      : int = None
+    ) -> Memory:
+        encode_agent = EncodeAgent()
+        encode_agent.encode_subjects(subject_path)
+        encode_agent.encode_students(student_path)
+        roster = encode_agent.roster
+        copies = copies or COPIES
+
+        collect()
+        tracing = is_tracing()
+        if not tracing:
+            start()
+        before = get_traced_memory()[0]
+        clones = [
+            self.clone(student, f'{student.id}-{copy}', len(roster) * (copy + 1) + index)
+                for copy in range(copies)
+                for index, student in enumerate(roster)
+        ]
+        size   = get_traced_memory()[0] - before
+        if not tracing:
+            stop()
+        return Memory(len(clones), size)
+
+
+bench_agent = BenchAgent()
+
+
+if __name__ == '__main__':
+    print(bench_agent.memory(
+        'input\\Test data_ Subjects.xlsx',
+        'input\\Test data_ Students.xlsx'
+    ))
@@ -0,0 +1,111 @@
+from src.cls.main        import Student
+from src.gnt.enlist.main import EnlistAgent
+from src.gnt.enlist.main import Round
+from time                import perf_counter
+from typing              import Iterable
+
+
+class BulkAgent:
+    def constrained(self, student: Student) -> bool:
+        return bool(student.prerequisites or student.not_alongside or student.memberships)
+
+    def key(self, student: Student) -> tuple:
+        return (
+            student.grade_level,
+            student.shift,
+            student.previous,
+            frozenset(student.attends),
+            frozenset(student.sessions),
+            tuple(
+                tuple(student.rankings.final.all(type))
+                    for type in sorted(student.grade_level.to_rank)
+            )
+        )
+
+    def cohorts(self, students: Iterable[Student]) -> list[list[Student]]:
+        cohorts = dict[tuple, list[Student]]()
+        for student in students:
+            cohorts.setdefault(self.key(student), list()).append(student)
+        return list(cohorts.values())
+
+    def split(self, members: list[Student]) -> list[list[Student]]:
+        if len(members) == 1:
+            return [members]
+        cohorts = dict[tuple[int, frozenset[str]], list[Student]]()
+        for student in members:
+            cohorts.setdefault((student.attends_mask, frozenset(student.sessions)), list()).append(student)
+        return list(cohorts.values())
+
+    def queue(self, cohorts: list[list[Student]]) -> list[tuple[list[Student], str]]:
+        return [
+            (cohort, type)
+                for cohort in cohorts
+                for type in sorted(cohort[0].grade_level.to_rank)
+                if cohort[0].subjects.get(type) is None and cohort[0].categories.get(type) is None
+        ]
+
+    def propose(
+        self,
+        cohort: list[Student],
+        type  : str
+    ) -> tuple[int, list[Student]]:
+        student = cohort[0]
+        object  = student.rankings.final.get(type)
+        placed  = 0
+        if student.propose(type):
+            placed = 1 + object.admit(cohort[1:])
+            for student_ in cohort[1:placed]:
+                student_.assign(type, object)
+            cohort = cohort[placed:]
+            if not cohort:
+                return placed, cohort
+            student = cohort[0]
+            if student.propose(type):
+                raise Exception()
+        reason = student.rankings.final.last(type)
+        for student_ in cohort[1:]:
+            student_.rankings.final.reject(type, reason)
+        return placed, cohort
+
+    def enlist(self, students: Iterable[Student]) -> list[Round]:
+        students    = list(students)
+        constrained = [student for student in students if self.constrained(student)]
+        free        = [student for student in students if not self.constrained(student)]
+
+        rounds = EnlistAgent().enlist(constrained)
+        queue  = self.queue(self.cohorts(free))
+        while queue:
+            start     = perf_counter()
+            pending   = list[tuple[list[Student], str]]()
+            proposals = 0
+            accepted  = 0
+            rejected  = 0
+            exhausted = 0
+            for members, type in queue:
+                for cohort in self.split(members):
+                    if not cohort[0].rankings.final.count(type):
+                        exhausted += len(cohort)
+                        continue
+                    placed, cohort = self.propose(cohort, type)
+                    proposals += placed + len(cohort)
+                    accepted  += placed
+                    rejected  += len(cohort)
+                    if not cohort:
+                        continue
+                    elif cohort[0].rankings.final.count(type):
+                        pending.append((cohort, type))
+                    else:
+                        exhausted += len(cohort)
+            rounds.append(Round(
+                index=len(rounds) + 1,
+                proposals=proposals,
+                accepted=accepted,
+                rejected=rejected,
+                exhausted=exhausted,
+                elapsed=perf_counter() - start
+            ))
+            queue = pending
+        return rounds
+
+
+bulk_agent = BulkAgent()
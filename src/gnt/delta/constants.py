@@ -0,0 +1,6 @@
+EVENT_TEMPLATE = '{} {} {}: {}'
+DELTA_TEMPLATE = (
+    'Delta: {} students, {} objects dirty; '
+    '{} rolled back, {} replayed, {} recomputed ({:.3f}s)'
+)
+FORK_TEMPLATE = 'Fork: {} events from log index {}, {} own; {} placements changed'
@@ -0,0 +1,632 @@
+from __future__ import annotations
+
+from src.gnt.delta.constants import *
+
+from src.cls.main  import Student
+from src.cls.main  import Section
+from src.cls.main  import Subject
+from src.cls.main  import Category
+from src.cls.main  import Reason
+from heapq         import heappush
+from heapq         import heappop
+from bisect        import bisect_left
+from itertools     import count
+from time          import perf_counter
+from typing        import Iterable
+
+
+class Event:
+    def __init__(
+        self,
+        key      : tuple[int, int, int],
+        student  : Student,
+        type     : str,
+        subject  : Subject | Category,
+        qualified: bool,
+        section  : Section                  = None,
+        reason   : Reason                   = None,
+        block    : list[tuple[Student, str]] = None
+    ) -> None:
+        self._key       = key
+        self._student   = student
+        self._type      = type
+        self._subject   = subject
+        self._qualified = qualified
+        self._section   = section
+        self._reason    = reason
+        self._block     = block or list()
+
+    def __repr__(self) -> str:
+        return EVENT_TEMPLATE.format(self.key, self.student, self.type, self.subject)
+
+    @property
+    def key(self) -> tuple[int, int, int]:
+        return self._key
+
+    @property
+    def student(self) -> Student:
+        return self._student
+
+    @property
+    def type(self) -> str:
+        return self._type
+
+    @property
+    def subject(self) -> Subject | Category:
+        return self._subject
+
+    @property
+    def qualified(self) -> bool:
+        return self._qualified
+
+    @property
+    def section(self) -> Section | None:
+        return self._section
+
+    @property
+    def reason(self) -> Reason | None:
+        return self._reason
+
+    @property
+    def block(self) -> list[tuple[Student, str]]:
+        return self._block
+
+
+class Delta:
+    def __init__(
+        self,
+        students  : int,
+        objects   : int,
+        rolled    : int   = None,
+        replayed  : int   = None,
+        recomputed: int   = None,
+        elapsed   : float = None
+    ) -> None:
+        self._students   = students
+        self._objects    = objects
+        self._rolled     = rolled or int()
+        self._replayed   = replayed or int()
+        self._recomputed = recomputed or int()
+        self._elapsed    = elapsed or float()
+
+    def __repr__(self) -> str:
+        return DELTA_TEMPLATE.format(
+            self.students,
+            self.objects,
+            self.rolled,
+            self.replayed,
+            self.recomputed,
+            self.elapsed
+        )
+
+    @property
+    def students(self) -> int:
+        return self._students
+
+    @property
+    def objects(self) -> int:
+        return self._objects
+
+    @property
+    def rolled(self) -> int:
+        return self._rolled
+
+    @property
+    def replayed(self) -> int:
+        return self._replayed
+
+    @property
+    def recomputed(self) -> int:
+        return self._recomputed
+
+    @property
+    def elapsed(self) -> float:
+        return self._elapsed
+
+
+class Change:
+    def __init__(
+        self,
+        rankings: dict[tuple[Student, str], list[Subject | Category]] = None,
+        maximums: dict[Section, int]                                  = None,
+        opened  : list[Section]                                       = None,
+        closed  : list[Section]                                       = None
+    ) -> None:
+        self._rankings = rankings or dict()
+        self._maximums = maximums or dict()
+        self._opened   = opened or list()
+        self._closed   = closed or list()
+
+    @property
+    def rankings(self) -> dict[tuple[Student, str], list[Subject | Category]]:
+        return self._rankings
+
+    @property
+    def maximums(self) -> dict[Section, int]:
+        return self._maximums
+
+    @property
+    def opened(self) -> list[Section]:
+        return self._opened
+
+    @property
+    def closed(self) -> list[Section]:
+        return self._closed
+
+    @property
+    def students(self) -> set[Student]:
+        return set(student for student, type in self.rankings)
+
+    @property
+    def objects(self) -> set[Subject | Category]:
+        return set(
+            section.parent
+                for sections in (self.maximums, self.opened, self.closed)
+                for section in sections
+        )
+
+    def rank(
+        self,
+        student : Student,
+        type    : str,
+        subjects: list[Subject | Category]
+    ) -> None:
+        if type not in student.grade_level.to_rank:
+            raise Exception()
+        else:
+            self.rankings[student, type] = list(subjects)
+
+    def resize(
+        self,
+        section: Section,
+        maximum: int
+    ) -> None:
+        if maximum < section.capacity.ideal:
+            raise Exception()
+        else:
+            self.maximums[section] = maximum
+
+    def open(self, section: Section) -> None:
+        if section in section.parent.sections or section in self.opened:
+            raise Exception()
+        else:
+            self.opened.append(section)
+
+
+class Enlistment:
+    def __init__(self, students: Iterable[Student]) -> None:
+        self._students  = list(students)
+        self._positions = dict((student, position) for position, student in enumerate(self.students))
+        self._types     = dict(
+            (student, sorted(student.grade_level.to_rank))
+                for student in self.students
+        )
+        self._log       = list[Event]()
+        self._change    = Change()
+        self._counter   = count()
+        self._version   = int()
+
+    @property
+    def students(self) -> list[Student]:
+        return self._students
+
+    @property
+    def log(self) -> list[Event]:
+        return self._log
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def rank(
+        self,
+        student : Student,
+        type    : str,
+        subjects: list[Subject | Category]
+    ) -> None:
+        if student not in self._positions:
+            raise Exception()
+        else:
+            self._change.rank(student, type, subjects)
+
+    def resize(
+        self,
+        section: Section,
+        maximum: int
+    ) -> None:
+        self._change.resize(section, maximum)
+
+    def open(self, section: Section) -> None:
+        self._change.open(section)
+
+    def apply(self, change: Change) -> Change:
+        inverse = Change()
+        for (student, type), subjects in change.rankings.items():
+            inverse.rankings[student, type] = list(student.rankings.final.all(type))
+            student.default_ranking(type, subjects)
+        for section, maximum in change.maximums.items():
+            parent = section.parent
+            inverse.maximums[section] = section.capacity.maximum
+            parent.capacity.maximum  += maximum - section.capacity.maximum
+            section.capacity.maximum  = maximum
+            if section in parent.sections:
+                parent.refresh(section)
+        for section in change.opened:
+            section.parent.add_section(section)
+            inverse.closed.append(section)
+        for section in change.closed:
+            if section.parent.close(section):
+                raise Exception()
+            inverse.opened.append(section)
+        return inverse
+
+    def reads(self, event: Event) -> Iterable[Student]:
+        group = event.student.group(event.subject)
+        if group is not None:
+            yield from group.students
+        yield from event.student.prerequisites
+        yield from event.student.not_alongside
+
+    def push(
+        self,
+        heap   : list[tuple[tuple[int, int, int], int, Event | None, Student | None]],
+        key    : tuple[int, int, int],
+        event  : Event   = None,
+        student: Student = None
+    ) -> None:
+        heappush(heap, (key, next(self._counter), event, student))
+
+    def schedule(
+        self,
+        heap   : list[tuple[tuple[int, int, int], int, Event | None, Student | None]],
+        student: Student,
+        round  : int,
+        types  : Iterable[str] = None
+    ) -> None:
+        types_ = self._types[student]
+        for type in types_ if types is None else types:
+            if student.subjects.get(type) is not None or student.categories.get(type) is not None:
+                continue
+            elif student.rankings.final.count(type):
+                self.push(heap, (round, self._positions[student], types_.index(type)), student=student)
+
+    def rollback(self, event: Event) -> None:
+        for student, type in reversed([(event.student, event.type)] + event.block):
+            if event.qualified:
+                student.drop(event.subject)
+            else:
+                student.rankings.final.restore(type, event.subject)
+
+    def replay(self, event: Event) -> None:
+        if event.qualified and event.block:
+            event.subject.seat_block([(event.student, event.type)] + event.block, event.section)
+            return
+        for student, type in [(event.student, event.type)] + event.block:
+            if event.qualified:
+                sections = None if event.section is None else [event.section]
+                if isinstance(event.subject, Subject):
+                    qualified, reason = student.add_subject(type, event.subject, sections)
+                else:
+                    qualified, reason = student.add_category(type, event.subject, sections)
+                if not qualified:
+                    raise Exception(reason)
+            else:
+                student.rankings.final.reject(type, event.reason)
+
+    def same(
+        self,
+        event : Event,
+        event_: Event
+    ) -> bool:
+        return (event.subject, event.qualified, event.section, event.reason, event.block) \
+            == (event_.subject, event_.qualified, event_.section, event_.reason, event_.block)
+
+    def propose(
+        self,
+        key    : tuple[int, int, int],
+        student: Student,
+        type   : str
+    ) -> Event:
+        final     = student.rankings.final
+        subject   = final.get(type)
+        block     = student.block(type)
+        qualified = student.propose(type)
+        if qualified:
+            return Event(key, student, type, subject, True, student.sections.get(subject), block=block)
+        else:
+            return Event(
+                key,
+                student,
+                type,
+                subject,
+                False,
+                reason=final.last(type),
+                block=block
+            )
+
+    def release(
+        self,
+        heap    : list[tuple[tuple[int, int, int], int, Event | None, Student | None]],
+        key     : tuple[int, int, int],
+        block   : list[tuple[Student, str]],
+        students: set[Student],
+        live    : set[tuple[Student, str]]
+    ) -> None:
+        for student, type in block:
+            students.add(student)
+            if (student, type) not in live:
+                live.add((student, type))
+                self.push(heap, (key[0], self._positions[student], self._types[student].index(type)), student=student)
+
+    def affected(
+        self,
+        students: set[Student],
+        objects : set[Subject | Category]
+    ) -> int:
+        first = len(self.log)
+        for index, event in enumerate(self.log):
+            if event.student in students or event.subject in objects:
+                first = index
+                break
+            elif any(student in students for student, type in event.block):
+                first = index
+                break
+        if students:
+            floor = (1, min(self._positions[student] for student in students), 0)
+            first = min(first, bisect_left([event.key for event in self.log], floor))
+        return first
+
+    def rewind(self, first: int) -> list[Event]:
+        events = self.log[first:]
+        for event in reversed(events):
+            self.rollback(event)
+        del self.log[first:]
+        return events
+
+    def restore(self, events: list[Event]) -> None:
+        for event in events:
+            self.replay(event)
+            self.log.append(event)
+
+    def forward(
+        self,
+        pending : list[Event],
+        students: set[Student],
+        objects : set[Subject | Category]
+    ) -> tuple[int, int]:
+        heap = list[tuple[tuple[int, int, int], int, Event | None, Student | None]]()
+        live = set[tuple[Student, str]]()
+        for event in pending:
+            self.push(heap, event.key, event)
+        for student in sorted(students, key=self._positions.get):
+            self.schedule(heap, student, 1)
+            live.update((student, type) for type in self._types[student])
+
+        replayed   = 0
+        recomputed = 0
+        while heap:
+            key, order, event, student = heappop(heap)
+            if event is not None:
+                if event.student in students or any(other in students for other in self.reads(event)):
+                    students.add(event.student)
+                    self.release(heap, key, event.block, students, live)
+                    if event.qualified:
+                        objects.add(event.subject)
+                    if (event.student, event.type) not in live:
+                        live.add((event.student, event.type))
+                        self.push(heap, key, student=event.student)
+                    continue
+                elif event.subject not in objects:
+                    self.replay(event)
+                    self.log.append(event)
+                    replayed += 1
+                    continue
+                event_ = self.propose(key, event.student, event.type)
+                recomputed += 1
+                if self.same(event, event_):
+                    self.log.append(event)
+                    continue
+                self.log.append(event_)
+                students.add(event.student)
+                live.add((event.student, event.type))
+                self.release(heap, key, event.block + event_.block, students, live)
+                if event.qualified:
+                    objects.add(event.subject)
+                if event_.qualified:
+                    objects.add(event_.subject)
+                else:
+                    self.schedule(heap, event.student, key[0] + 1, (event.type,))
+                continue
+
+            type = self._types[student][key[2]]
+            if student.subjects.get(type) is not None or student.categories.get(type) is not None:
+                continue
+            elif not student.rankings.final.count(type):
+                continue
+            event_ = self.propose(key, student, type)
+            self.log.append(event_)
+            recomputed += 1
+            if event_.qualified:
+                objects.add(event_.subject)
+            else:
+                self.schedule(heap, student, key[0] + 1, (type,))
+        return replayed, recomputed
+
+    def enlist(
+        self,
+        students: Iterable[Student]            = None,
+        objects : Iterable[Subject | Category] = None
+    ) -> Delta:
+        start    = perf_counter()
+        students = set(self.students if students is None and not self.log else students or ())
+        students.update(self._change.students)
+        objects  = set(objects or ())
+        objects.update(self._change.objects)
+
+        first   = self.affected(students, objects)
+        pending = self.rewind(first)
+        self.apply(self._change)
+        self._change   = Change()
+        self._version += 1
+
+        replayed, recomputed = self.forward(pending, students, objects)
+        return Delta(
+            students=len(students),
+            objects=len(objects),
+            rolled=len(pending),
+            replayed=replayed,
+            recomputed=recomputed,
+            elapsed=perf_counter() - start
+        )
+
+    def fork(self) -> Fork:
+        return Fork(self)
+
+
+class Fork:
+    def __init__(self, base: Enlistment) -> None:
+        self._base    = base
+        self._version = base.version
+        self._change  = Change()
+        self._first   = None
+        self._events  = None
+        self._redo    = None
+        self._undo    = None
+        self._tail    = None
+
+    def __repr__(self) -> str:
+        return FORK_TEMPLATE.format(
+            len(self.events or ()),
+            self.first,
+            self.own,
+            len(self.compare())
+        )
+
+    def __enter__(self) -> Fork:
+        if self.events is None or self._tail is not None:
+            raise Exception()
+        elif self.version != self.base.version:
+            raise Exception()
+        else:
+            self._tail = self.base.rewind(self.first)
+            self._undo = self.base.apply(self._redo)
+            self.base.restore(self.events)
+            return self
+
+    def __exit__(self, *args) -> None:
+        self.base.rewind(self.first)
+        self._redo = self.base.apply(self._undo)
+        self.base.restore(self._tail)
+        self._tail = None
+
+    @property
+    def base(self) -> Enlistment:
+        return self._base
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def change(self) -> Change:
+        return self._change
+
+    @property
+    def first(self) -> int | None:
+        return self._first
+
+    @property
+    def events(self) -> list[Event] | None:
+        return self._events
+
+    @property
+    def own(self) -> int:
+        shared = set(map(id, self.base.log[self.first:])) if self.events is not None else set()
+        return sum(id(event) not in shared for event in self.events or ())
+
+    def rank(
+        self,
+        student : Student,
+        type    : str,
+        subjects: list[Subject | Category]
+    ) -> None:
+        if self.events is not None:
+            raise Exception()
+        elif student not in self.base.students:
+            raise Exception()
+        else:
+            self.change.rank(student, type, subjects)
+
+    def resize(
+        self,
+        section: Section,
+        maximum: int
+    ) -> None:
+        if self.events is not None:
+            raise Exception()
+        else:
+            self.change.resize(section, maximum)
+
+    def open(self, section: Section) -> None:
+        if self.events is not None:
+            raise Exception()
+        else:
+            self.change.open(section)
+
+    def enlist(
+        self,
+        students: Iterable[Student]            = None,
+        objects : Iterable[Subject | Category] = None
+    ) -> Delta:
+        if self.events is not None or self.version != self.base.version:
+            raise Exception()
+        start    = perf_counter()
+        students = set(students or ()) | self.change.students
+        objects  = set(objects or ()) | self.change.objects
+
+        base    = self.base
+        first   = base.affected(students, objects)
+        pending = base.rewind(first)
+        undo    = base.apply(self.change)
+        replayed, recomputed = base.forward(list(pending), students, objects)
+
+        self._first  = first
+        self._events = base.rewind(first)
+        self._redo   = base.apply(undo)
+        base.restore(pending)
+        return Delta(
+            students=len(students),
+            objects=len(objects),
+            rolled=len(pending),
+            replayed=replayed,
+            recomputed=recomputed,
+            elapsed=perf_counter() - start
+        )
+
+    def placements(self, events: list[Event]) -> dict[tuple[Student, str], tuple[Subject | Category, Section | None]]:
+        return dict(
+            ((event.student, event.type), (event.subject, event.section))
+                for event in events
+                if event.qualified
+        )
+
+    def compare(self) -> list[tuple[Student, str, tuple | None, tuple | None]]:
+        if self.events is None:
+            return list()
+        before = self.placements(self.base.log[self.first:])
+        after  = self.placements(self.events)
+        return [
+            (student, type, before.get((student, type)), after.get((student, type)))
+                for student, type in dict.fromkeys(list(before) + list(after))
+                if before.get((student, type)) != after.get((student, type))
+        ]
+
+
+class DeltaAgent:
+    def start(self, students: Iterable[Student]) -> Enlistment:
+        enlistment = Enlistment(students)
+        enlistment.enlist()
+        return enlistment
+
+
+delta_agent = DeltaAgent()
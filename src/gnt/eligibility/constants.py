@@ -0,0 +1,2 @@
+NONE     = -1
+NO_SHIFT = -1
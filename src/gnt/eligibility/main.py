@@ -0,0 +1,233 @@
+from src.gnt.eligibility.constants import *
+
+from src.cls.main import Student
+from src.cls.main import Section
+from src.cls.main import Subject
+from src.cls.main import Category
+from numpy        import ndarray
+from numpy        import array
+from numpy        import ones
+from numpy        import zeros
+from numpy        import flatnonzero
+from numpy        import int32
+from typing       import Iterable
+
+
+class Eligibility:
+    def __init__(
+        self,
+        students: list[Student],
+        sections: list[Section]
+    ) -> None:
+        self._students = list(students)
+        self._sections = list(sections)
+        self._rows     = dict((student, row) for row, student in enumerate(self.students))
+        self._columns  = dict((section, column) for column, section in enumerate(self.sections))
+
+        objects = dict[Subject | Category, int]()
+        for section in self.sections:
+            objects.setdefault(section.parent, len(objects))
+        for parent in list(objects):
+            for prerequisites in parent.prerequisites:
+                for object in prerequisites:
+                    objects.setdefault(object, len(objects))
+            for object in parent.not_alongside:
+                objects.setdefault(object, len(objects))
+        self._objects = objects
+
+        shifts      = dict((shift, code) for code, shift in enumerate(set(
+            section.shift
+                for section in self.sections
+        )))
+        partitions  = dict((partition, code) for code, partition in enumerate(set(
+            section.parallel_session.partition
+                for section in self.sections
+        )))
+        grade_levels = dict((grade_level, code) for code, grade_level in enumerate(set(
+            student.grade_level
+                for student in self.students
+        )))
+
+        self._parents    = array(
+            [objects[section.parent] for section in self.sections],
+            dtype=int32
+        ).reshape(-1)
+        self._partitions = array(
+            [partitions[section.parallel_session.partition] for section in self.sections],
+            dtype=int32
+        ).reshape(-1)
+        self._children   = dict[Subject | Category, ndarray]()
+        for column, section in enumerate(self.sections):
+            self._children.setdefault(section.parent, list()).append(column)
+        for parent, columns in self._children.items():
+            self._children[parent] = array(columns, dtype=int32)
+
+        student_shifts = array(
+            [shifts.get(student.shift, NO_SHIFT) for student in self.students],
+            dtype=int32
+        ).reshape(-1)
+        section_shifts = array(
+            [shifts[section.shift] for section in self.sections],
+            dtype=int32
+        ).reshape(-1)
+        self._shift    = (student_shifts[:, None] == NO_SHIFT) \
+            | (student_shifts[:, None] == section_shifts[None, :])
+
+        teaches = zeros((len(grade_levels), len(self.sections)), dtype=bool)
+        for column, section in enumerate(self.sections):
+            if not isinstance(section.parent, Subject):
+                teaches[:, column] = True
+                continue
+            for grade_level in section.parent.teaches:
+                if grade_level in grade_levels:
+                    teaches[grade_levels[grade_level], column] = True
+        self._grade_level = teaches[array(
+            [grade_levels[student.grade_level] for student in self.students],
+            dtype=int32
+        ).reshape(-1)]
+
+        taken   = self.incidence(student.taken for student in self.students)
+        attends = self.incidence(student.attends for student in self.students)
+
+        satisfied = ones((len(self.students), len(objects)), dtype=bool)
+        for parent in self._children:
+            code = objects[parent]
+            for prerequisites in parent.prerequisites:
+                satisfied[:, code] &= taken[:, [objects[object] for object in prerequisites]].any(axis=1)
+        self._prerequisites = satisfied[:, self._parents]
+
+        excludes = zeros((len(objects), len(objects)), dtype=int32)
+        for parent in self._children:
+            for object in parent.not_alongside:
+                excludes[objects[parent], objects[object]] = 1
+        self._excludes      = dict(
+            (code, flatnonzero(excludes[self._parents, code]))
+                for code in set(objects.values())
+        )
+        self._not_alongside = ~((attends.astype(int32) @ excludes.T) > 0)[:, self._parents]
+
+        occupied = zeros((len(self.students), len(partitions)), dtype=bool)
+        for row, student in enumerate(self.students):
+            for partition, section in student.sessions.items():
+                if section is not None and partition in partitions:
+                    occupied[row, partitions[partition]] = True
+        self._sessions = ~occupied[:, self._partitions]
+        self._blocked  = self._partitions[:, None] == self._partitions[None, :]
+        for column in range(len(self.sections)):
+            self._blocked[column, self._excludes[self._parents[column]]] = True
+
+        self._codes   = dict((parent, code) for code, parent in enumerate(self._children))
+        self._members = zeros((len(self._codes), len(self.sections)), dtype=bool)
+        for parent, code in self._codes.items():
+            self._members[code, self._children[parent]] = True
+
+        self._open     = array(
+            [section.capacity.available > 0 for section in self.sections],
+            dtype=bool
+        ).reshape(-1)
+        self._eligible = self.shift \
+            & self.grade_level \
+            & self.prerequisites \
+            & self.not_alongside \
+            & self.sessions \
+            & self.open[None, :]
+
+    @property
+    def students(self) -> list[Student]:
+        return self._students
+
+    @property
+    def sections(self) -> list[Section]:
+        return self._sections
+
+    @property
+    def shift(self) -> ndarray:
+        return self._shift
+
+    @property
+    def grade_level(self) -> ndarray:
+        return self._grade_level
+
+    @property
+    def prerequisites(self) -> ndarray:
+        return self._prerequisites
+
+    @property
+    def not_alongside(self) -> ndarray:
+        return self._not_alongside
+
+    @property
+    def sessions(self) -> ndarray:
+        return self._sessions
+
+    @property
+    def open(self) -> ndarray:
+        return self._open
+
+    @property
+    def eligible(self) -> ndarray:
+        return self._eligible
+
+    def incidence(self, rows: Iterable[Iterable[Subject | Category]]) -> ndarray:
+        matrix = zeros((len(self.students), len(self._objects)), dtype=bool)
+        for row, objects in enumerate(rows):
+            for object in objects:
+                if object in self._objects:
+                    matrix[row, self._objects[object]] = True
+        return matrix
+
+    def screen(
+        self,
+        entries: list[tuple[Student, Subject | Category]]
+    ) -> ndarray:
+        rows   = array(
+            [self._rows.get(student, NONE) for student, parent in entries],
+            dtype=int32
+        ).reshape(-1)
+        codes  = array(
+            [self._codes.get(parent, NONE) for student, parent in entries],
+            dtype=int32
+        ).reshape(-1)
+        known  = (rows != NONE) & (codes != NONE)
+        viable = ones(len(entries), dtype=bool)
+        viable[known] = (self.eligible[rows[known]] & self._members[codes[known]]).any(axis=1)
+        return viable
+
+    def update(self, placements: list[tuple[Student, Section]]) -> None:
+        layers  = list[list[tuple[int, int]]]()
+        seen    = dict[int, int]()
+        columns = set[int]()
+        for student, section in placements:
+            if student not in self._rows or section not in self._columns:
+                continue
+            row, column = self._rows[student], self._columns[section]
+            layer       = seen.get(row, 0)
+            seen[row]   = layer + 1
+            if layer == len(layers):
+                layers.append(list())
+            layers[layer].append((row, column))
+            columns.add(column)
+        for layer in layers:
+            rows, columns_ = array(layer, dtype=int32).T
+            self.eligible[rows] &= ~self._blocked[columns_]
+
+        full = [
+            column
+                for column in columns
+                if self.sections[column].capacity.available <= 0
+        ]
+        if full:
+            self.open[full]        = False
+            self.eligible[:, full] = False
+
+
+class EligibilityAgent:
+    def build(
+        self,
+        students: Iterable[Student],
+        sections: Iterable[Section]
+    ) -> Eligibility:
+        return Eligibility(list(students), list(sections))
+
+
+eligibility_agent = EligibilityAgent()
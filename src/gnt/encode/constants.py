@@ -14,4 +14,9 @@ YES = 'Y'
 PREVIOUS_YEAR = 'Previous year'
 GROUP         = 'Group'
 
-DELIMITER = '||'
\ No newline at end of file
+DELIMITER = '||'
+
+SNAPSHOT_MAGIC     = b'RESABM'
+SNAPSHOT_VERSION   = 9
+SNAPSHOT_HEADER    = '>6sH32s'
+SNAPSHOT_TEMPORARY = '.tmp'
@@ -4,23 +4,47 @@ from src.cls.main       import GradeLevel
 from src.cls.main       import Subject
 from src.cls.main       import Category
 from src.cls.main       import Student
+from src.cls.main       import History
 from src.cls.main       import Group
 from src.cls.main       import Shift
 from src.cls.main       import Section
 from src.cls.main       import ParallelSession
 from src.cls.main       import Capacity
-from openpyxl           import load_workbook
-from src.gnt.write.main import writer_agent
+from src.gnt.read.main  import read_agent
+from hashlib            import sha256
+from pickle             import Pickler
+from pickle             import Unpickler
+from pickle             import UnpicklingError
+from pickle             import HIGHEST_PROTOCOL
+from struct             import calcsize
+from struct             import pack
+from struct             import unpack
+from zlib               import compress
+from zlib               import decompress
+from zlib               import error as ZlibError
+from io                 import BytesIO
+from os                 import fsync
+from os                 import replace
+from os.path            import exists
+from typing             import Any
 
 
 class EncodeAgent:
-    def __init__(self) -> None:
+    def __init__(self, engine: str = None) -> None:
+        self._engine       = engine
         self._grade_levels = dict[str, GradeLevel]()
         self._subjects     = dict[str, list[set[tuple[GradeLevel, bool, str]] | Subject]]()
         self._categories   = dict[str, list[set[tuple[GradeLevel, str]] | Category]]()
         self._students     = dict[GradeLevel, list[Student]]()
         self._groups       = dict[GradeLevel, dict[Subject | Category, dict[str, Group]]]()
         self._shifts       = dict[str, Shift]()
+        self._partitions   = dict[str, int]()
+        self._aliases      = dict[str, Subject | Category]()
+        self._normalized   = dict[str, Subject | Category]()
+        self._roster       = list[Student]()
+        self._catalog      = list[Subject | Category]()
+        self._histories    = dict[History, History]()
+        self._sections     = list[Section]()
 
     def __sort__(self) -> None:
         ...
@@ -31,6 +55,14 @@ class EncodeAgent:
     def __reset_students__(self) -> None:
         ...
 
+    @property
+    def engine(self) -> str | None:
+        return self._engine
+
+    @engine.setter
+    def engine(self, value: str) -> None:
+        self._engine = value
+
     @property
     def grade_levels(self) -> dict[str, GradeLevel]:
         return self._grade_levels
@@ -55,41 +87,209 @@ class EncodeAgent:
     def shifts(self) -> dict[str, Shift]:
         return self._shifts
 
+    @property
+    def partitions(self) -> dict[str, int]:
+        return self._partitions
+
+    @property
+    def roster(self) -> list[Student]:
+        return self._roster
+
+    @property
+    def catalog(self) -> list[Subject | Category]:
+        return self._catalog
+
+    @property
+    def histories(self) -> dict[History, History]:
+        return self._histories
+
+    @property
+    def sections(self) -> list[Section]:
+        return self._sections
+
+    def history(
+        self,
+        grade_level: GradeLevel,
+        attends    : list[Subject | Category]
+    ) -> History:
+        history = History(grade_level, attends)
+        return self.histories.setdefault(history, history)
+
     def xlsx(
         self,
-        path : str,
-        sheet: str
-    ) -> list[list[str | None]]:
-        workbook  = load_workbook(filename=path, data_only=True)
-        worksheet = workbook[sheet]
-        data      = list()
-        for row in worksheet.rows:
-            line = list()
-            for cell in row:
-                if cell.value is None:
-                    line.append(cell.value)
-                elif isinstance(cell.value, float):
-                    line.append(str(int(cell.value)))
-                else:
-                    line.append(str(cell.value))
+        path  : str,
+        sheet : str,
+        engine: str = None
+    ) -> list[tuple[str | None, ...]]:
+        data = list()
+        for row in read_agent.rows(path, sheet, engine or self.engine):
+            line = tuple(
+                value if value is None
+                    else str(int(value)) if isinstance(value, float)
+                    else str(value)
+                        for value in row
+            )
             if not all(
                 cell == 'None'
                     for cell in line
             ):
                 data.append(line)
-        workbook.close()
         return data
 
+    @property
+    def aliases(self) -> dict[str, Subject | Category]:
+        return self._aliases
+
+    @property
+    def normalized(self) -> dict[str, Subject | Category]:
+        return self._normalized
+
+    def normalize(self, name: str) -> str:
+        return ' '.join(name.split()).casefold()
+
+    def register(
+        self,
+        name  : str,
+        object: Subject | Category
+    ) -> None:
+        if object.index is None:
+            object.index = len(self.catalog)
+            self.catalog.append(object)
+        self.aliases.setdefault(str(object), object)
+        for alias in (name, str(object)):
+            if isinstance(object, Subject):
+                self.normalized.setdefault(self.normalize(alias), object)
+            else:
+                self.normalized[self.normalize(alias)] = object
+
     def find(self, name: str) -> Subject | Category:
         if name in self.categories:
             return self.categories[name][1]
+        elif name in self.subjects:
+            return self.subjects[name][1]
+        elif name in self.aliases:
+            return self.aliases[name]
+        elif isinstance(name, str) and self.normalize(name) in self.normalized:
+            return self.normalized[self.normalize(name)]
         else:
-            if name in self.subjects:
-                return self.subjects[name][1]
-            else:
-                for data, subject in self.subjects.values():
-                    if str(subject) == name:
-                        return subject
+            raise Exception(f'Unknown subject or category: {name!r}')
+
+    def digest(self, *paths: str) -> bytes:
+        hash = sha256()
+        for path in paths:
+            with open(path, 'rb') as file:
+                content = file.read()
+            hash.update(pack('>Q', len(content)))
+            hash.update(content)
+        return hash.digest()
+
+    def entities(self) -> tuple[list[Student], list[Subject | Category], list[Section]]:
+        return self.roster, self.catalog, self.sections
+
+    def slots(self, entity: Student | Subject | Category | Section) -> dict[str, Any]:
+        return dict(
+            (name, getattr(entity, name))
+                for cls in type(entity).__mro__
+                for name in getattr(cls, '__slots__', ())
+                if hasattr(entity, name)
+        )
+
+    def freeze(self) -> bytes:
+        tables = self.entities()
+        codes  = dict(
+            (id(entity), (kind, index))
+                for kind, table in enumerate(tables)
+                for index, entity in enumerate(table)
+                if entity.index == index
+        )
+        state  = dict(
+            (key, value)
+                for key, value in vars(self).items()
+                if key != '_engine'
+        )
+        buffer  = BytesIO()
+        pickler = Pickler(buffer, HIGHEST_PROTOCOL)
+        pickler.persistent_id = lambda object: codes.get(id(object))
+        pickler.dump([[type(entity) for entity in table] for table in tables])
+        pickler.dump((state, [[self.slots(entity) for entity in table] for table in tables]))
+        return compress(buffer.getvalue())
+
+    def thaw(self, data: bytes) -> None:
+        unpickler = Unpickler(BytesIO(decompress(data)))
+        classes   = unpickler.load()
+        entities  = [[None] * len(table) for table in classes]
+
+        def load(code: tuple[int, int]) -> Student | Subject | Category | Section:
+            kind, index = code
+            entity      = entities[kind][index]
+            if entity is None:
+                entity        = classes[kind][index].__new__(classes[kind][index])
+                entity._index = index
+                entities[kind][index] = entity
+            return entity
+
+        unpickler.persistent_load = load
+        state, tables = unpickler.load()
+        for kind, table in enumerate(tables):
+            for index, slots in enumerate(table):
+                entity = load((kind, index))
+                for name, value in slots.items():
+                    setattr(entity, name, value)
+        vars(self).update(state)
+
+    def snapshot(
+        self,
+        path  : str,
+        *inputs: str
+    ) -> None:
+        with open(path + SNAPSHOT_TEMPORARY, 'wb') as file:
+            file.write(pack(
+                SNAPSHOT_HEADER,
+                SNAPSHOT_MAGIC,
+                SNAPSHOT_VERSION,
+                self.digest(*inputs)
+            ))
+            file.write(self.freeze())
+            file.flush()
+            fsync(file.fileno())
+        replace(path + SNAPSHOT_TEMPORARY, path)
+
+    def restore(
+        self,
+        path  : str,
+        *inputs: str
+    ) -> bool:
+        if not exists(path):
+            return False
+        with open(path, 'rb') as file:
+            header = file.read(calcsize(SNAPSHOT_HEADER))
+            if len(header) < calcsize(SNAPSHOT_HEADER):
+                return False
+            magic, version, digest = unpack(SNAPSHOT_HEADER, header)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                return False
+            elif digest != self.digest(*inputs):
+                return False
+            data = file.read()
+        try:
+            self.thaw(data)
+        except (ZlibError, UnpicklingError, EOFError, AttributeError, IndexError, ValueError):
+            return False
+        return True
+
+    def encode(
+        self,
+        subject_path : str,
+        student_path : str,
+        snapshot_path: str = None
+    ) -> None:
+        if snapshot_path is not None:
+            if self.restore(snapshot_path, subject_path, student_path):
+                return
+        self.encode_subjects(subject_path)
+        self.encode_students(student_path)
+        if snapshot_path is not None:
+            self.snapshot(snapshot_path, subject_path, student_path)
 
     def encode_subjects(
         self,
@@ -99,7 +299,7 @@ class EncodeAgent:
         if reset:
             self.__reset__()
         
-        for sheet in writer_agent.get_sheetnames(path):
+        for sheet in read_agent.get_sheetnames(path, self.engine):
             if sheet.find(GRADE_LEVEL) != -1:
                 data        = self.xlsx(path, sheet)
                 grade_level = int(data[0][1])
@@ -115,7 +315,7 @@ class EncodeAgent:
             name  = data[r][0]
             shift = Shift(name)
             for c in range(2, 2 + int(data[r][1])):
-                shift.add(data[r][c])
+                shift.add(data[r][c], self.partitions.setdefault(data[r][c], len(self.partitions)))
             self.shifts[name] = shift
 
         data = self.xlsx(path, CLASSIFICATION)
@@ -136,6 +336,7 @@ class EncodeAgent:
                             teaches={grade_level}
                         )
                         self.categories[name] = [{(grade_level, type)}, category]
+                        self.register(name, category)
                     else:
                         self.categories[name][0].add((grade_level, type))
                         self.categories[name][1].teaches.add(grade_level)
@@ -156,6 +357,7 @@ class EncodeAgent:
                             teaches={grade_level}
                         )
                         self.subjects[name] = [{(grade_level, ranked, type)}, subject]
+                        self.register(name, subject)
                     else:
                         subject_ = Subject(name=name, level=level, types={})
                         if str(self.subjects[name][1]) == str(subject_):
@@ -176,6 +378,7 @@ class EncodeAgent:
                                     {(grade_level, ranked, type)},
                                     subject_
                                 ]
+                                self.register(str(subject_), subject_)
                             else:
                                 self.subjects[name_][0].add((grade_level, ranked, type))
                                 self.subjects[name_][1].teaches.add(grade_level)
@@ -202,10 +405,10 @@ class EncodeAgent:
         data = self.xlsx(path, SECTIONS)
         for r in range(2, len(data)):
             object = self.find(data[r][0])
-            for c in range(2, 2 + int(data[r][1]), 6):
+            for c in range(2, 2 + 6 * int(data[r][1]), 6):
                 shift = self.shifts[data[r][c + 2]]
                 index = None if not data[r][c + 1].isdigit() else int(data[r][c + 1])
-                object.add_section(Section(
+                section = Section(
                     shift=shift,
                     parallel_session=ParallelSession(
                         shift=shift,
@@ -217,8 +420,17 @@ class EncodeAgent:
                         ideal=int(data[r][c + 4]),
                         maximum=int(data[r][c + 5])
                     ),
-                    parent=object
-                ))
+                    parent=object,
+                    index=len(self.sections)
+                )
+                object.add_section(section)
+                self.sections.append(section)
+
+        self.compile()
+
+    def compile(self) -> None:
+        for object in self.catalog:
+            object.compile()
 
     def encode_students(
         self,
@@ -229,7 +441,7 @@ class EncodeAgent:
             self.__reset_students__()
 
         # Groups need to be processed first
-        for sheet in writer_agent.get_sheetnames(path):
+        for sheet in read_agent.get_sheetnames(path, self.engine):
             if sheet.find(GROUPS) != -1:
                 data   = self.xlsx(path, sheet)
                 parent = self.find(data[0][1])
@@ -246,7 +458,7 @@ class EncodeAgent:
                         required=data[r][1].upper() == YES
                     )
                     self.groups[grade_level][parent][id] = group
-        for sheet in writer_agent.get_sheetnames(path):
+        for sheet in read_agent.get_sheetnames(path, self.engine):
             if sheet.find(GRADE_LEVEL) != -1:
                 data = self.xlsx(path, sheet)
                 for r in range(2, len(data)):
@@ -255,7 +467,8 @@ class EncodeAgent:
                         self.students[grade_level] = list[Student]()
 
                     id      = data[r][1]
-                    student = Student(id=id, grade_level=grade_level)
+                    student = Student(id=id, grade_level=grade_level, index=len(self.roster))
+                    self.roster.append(student)
 
                     c = 2
                     while data[0][c].upper() == GROUP.upper():
@@ -264,15 +477,16 @@ class EncodeAgent:
                         if id_ in self.groups[grade_level][parent]:
                             self.groups[grade_level][parent][id_].add_student(student)
                         c += 1
+                    attends = list[Subject | Category]()
                     while data[0][c].upper() == PREVIOUS_YEAR.upper():
-                        if student.previous is None:
-                            student_ = Student(
-                                id=id, 
-                                grade_level=self.grade_levels[str(grade_level.grade_level - 1)]
-                            )
-                            student.previous = student_
-                        student.previous.attends.add(self.find(data[r][c]))
+                        if data[r][c] is not None:
+                            attends.append(self.find(data[r][c]))
                         c += 1
+                    if attends:
+                        student.previous = self.history(
+                            self.grade_levels[str(grade_level.grade_level - 1)],
+                            attends
+                        )
                     for c_ in range(c, len(data[r])):
                         type = data[1][c_]
                         if data[r][c_] is None:
@@ -0,0 +1,3 @@
+ROUND_TEMPLATE    = 'Round {}: {} proposals, {} accepted, {} rejected, {} exhausted ({:.0f} proposals/s)'
+REPAIR_TEMPLATE   = 'Repair {}: {} closed, {} displaced, {} reseated, {} requeued, {} stranded, {} placed'
+STRANDED_TEMPLATE = 'Stranded: {} lost {} with no open section'
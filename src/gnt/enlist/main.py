@@ -0,0 +1,281 @@
+from src.gnt.enlist.constants import *
+
+from src.cls.main             import Student
+from src.cls.main             import Section
+from src.cls.main             import Subject
+from src.cls.main             import Category
+from src.cls.main             import Reason
+from src.gnt.eligibility.main import Eligibility
+from src.gnt.journal.main     import Journal
+from collections              import deque
+from time                     import perf_counter
+from typing                   import Iterable
+
+
+class Round:
+    def __init__(
+        self,
+        index    : int,
+        proposals: int   = None,
+        accepted : int   = None,
+        rejected : int   = None,
+        exhausted: int   = None,
+        elapsed  : float = None
+    ) -> None:
+        self._index     = index
+        self._proposals = proposals or int()
+        self._accepted  = accepted or int()
+        self._rejected  = rejected or int()
+        self._exhausted = exhausted or int()
+        self._elapsed   = elapsed or float()
+
+    def __repr__(self) -> str:
+        return ROUND_TEMPLATE.format(
+            self.index,
+            self.proposals,
+            self.accepted,
+            self.rejected,
+            self.exhausted,
+            self.throughput
+        )
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def proposals(self) -> int:
+        return self._proposals
+
+    @property
+    def accepted(self) -> int:
+        return self._accepted
+
+    @property
+    def rejected(self) -> int:
+        return self._rejected
+
+    @property
+    def exhausted(self) -> int:
+        return self._exhausted
+
+    @property
+    def elapsed(self) -> float:
+        return self._elapsed
+
+    @property
+    def throughput(self) -> float:
+        return self.proposals / self.elapsed if self.elapsed else float()
+
+
+class Repair:
+    def __init__(
+        self,
+        index    : int,
+        closed   : int                                      = None,
+        displaced: int                                      = None,
+        reseated : int                                      = None,
+        requeued : int                                      = None,
+        stranded : list[tuple[Student, Subject | Category]] = None,
+        rounds   : list[Round]                              = None
+    ) -> None:
+        self._index     = index
+        self._closed    = closed or int()
+        self._displaced = displaced or int()
+        self._reseated  = reseated or int()
+        self._requeued  = requeued or int()
+        self._stranded  = stranded or list()
+        self._rounds    = rounds or list()
+
+    def __repr__(self) -> str:
+        return REPAIR_TEMPLATE.format(
+            self.index,
+            self.closed,
+            self.displaced,
+            self.reseated,
+            self.requeued,
+            len(self.stranded),
+            self.placed
+        )
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def closed(self) -> int:
+        return self._closed
+
+    @property
+    def displaced(self) -> int:
+        return self._displaced
+
+    @property
+    def reseated(self) -> int:
+        return self._reseated
+
+    @property
+    def requeued(self) -> int:
+        return self._requeued
+
+    @property
+    def stranded(self) -> list[tuple[Student, Subject | Category]]:
+        return self._stranded
+
+    @property
+    def rounds(self) -> list[Round]:
+        return self._rounds
+
+    @property
+    def placed(self) -> int:
+        return sum(round.accepted for round in self.rounds)
+
+    def rows(self) -> list[str]:
+        return [
+            STRANDED_TEMPLATE.format(student, object)
+                for student, object in self.stranded
+        ]
+
+
+class EnlistAgent:
+    def queue(self, students: Iterable[Student]) -> deque[tuple[Student, str]]:
+        queue = deque[tuple[Student, str]]()
+        for student in students:
+            for type in sorted(student.grade_level.to_rank):
+                if student.subjects.get(type) is None and student.categories.get(type) is None:
+                    queue.append((student, type))
+        return queue
+
+    def enlist(
+        self,
+        students   : Iterable[Student],
+        eligibility: Eligibility                                                              = None,
+        log        : list[tuple[list[tuple[Student, str]], Subject | Category, Section | None]] = None,
+        journal    : Journal                                                                  = None,
+        limit      : int                                                                      = None
+    ) -> list[Round]:
+        rounds = list[Round]()
+        queue  = self.queue(students)
+        while queue and (limit is None or len(rounds) < limit):
+            start      = perf_counter()
+            pending    = deque[tuple[Student, str]]()
+            placements = list[tuple[Student, Section]]()
+            accepted   = 0
+            rejected   = 0
+            exhausted  = 0
+            if eligibility is not None:
+                entries = [
+                    (student, student.rankings.final.get(type))
+                        for student, type in queue
+                        if student.rankings.final.count(type)
+                ]
+                viable  = dict(zip(entries, eligibility.screen(entries).tolist()))
+            for student, type in queue:
+                if student.subjects.get(type) is not None or student.categories.get(type) is not None:
+                    continue
+                elif not student.rankings.final.count(type):
+                    exhausted += 1
+                    continue
+                subject = student.rankings.final.get(type)
+                block   = student.block(type)
+                if eligibility is None or block or viable.get((student, subject), True):
+                    qualified = student.propose(type)
+                else:
+                    qualified = student.propose(type, sections=list())
+                if qualified:
+                    accepted += 1 + len(block)
+                    members   = [(student, type)] + block
+                    section   = student.sections.get(subject)
+                    if eligibility is not None and section is not None:
+                        placements.extend((student_, section) for student_, type_ in members)
+                    if log is not None:
+                        log.append((members, subject, section))
+                    if journal is not None and block:
+                        journal.block(members, subject, section)
+                    elif journal is not None:
+                        journal.accept(student, type, subject, section)
+                else:
+                    rejected += 1 + len(block)
+                    if journal is not None:
+                        for student_, type_ in [(student, type)] + block:
+                            journal.reject(student_, type_, subject)
+                    if student.rankings.final.count(type):
+                        pending.append((student, type))
+                    else:
+                        exhausted += 1
+            if eligibility is not None:
+                eligibility.update(placements)
+            if journal is not None:
+                journal.commit()
+            rounds.append(Round(
+                index=len(rounds) + 1,
+                proposals=accepted + rejected,
+                accepted=accepted,
+                rejected=rejected,
+                exhausted=exhausted,
+                elapsed=perf_counter() - start
+            ))
+            queue = pending
+        return rounds
+
+    def closing(self, sections: Iterable[Section]) -> list[Section]:
+        closing = dict[Subject | Category, Section]()
+        for section in sections:
+            if section not in section.parent.sections:
+                continue
+            elif section.capacity.filled >= section.capacity.minimum:
+                continue
+            current = closing.get(section.parent)
+            if current is None or section.capacity.filled < current.capacity.filled:
+                closing[section.parent] = section
+        return list(closing.values())
+
+    def repair(self, sections: Iterable[Section]) -> list[Repair]:
+        children = dict[Subject | Category, list[Section]]()
+        for section in sections:
+            children.setdefault(section.parent, list()).append(section)
+        repairs  = list[Repair]()
+        closing  = self.closing(
+            section
+                for sections in children.values()
+                for section in sections
+        )
+        while closing:
+            displaced = 0
+            reseated  = 0
+            queue     = dict[Student, None]()
+            stranded  = list[tuple[Student, Subject | Category]]()
+            for section in closing:
+                parent = section.parent
+                for student in parent.close(section):
+                    displaced += 1
+                    if parent.select(student) is not None:
+                        reseated += 1
+                        continue
+                    type  = student.drop(parent)
+                    final = student.rankings.final
+                    if type not in student.grade_level.to_rank:
+                        stranded.append((student, parent))
+                        continue
+                    elif parent in final.all(type):
+                        final.reject(type, Reason.CLOSED, final.all(type).index(parent))
+                    if final.count(type):
+                        queue[student] = None
+            repairs.append(Repair(
+                index=len(repairs) + 1,
+                closed=len(closing),
+                displaced=displaced,
+                reseated=reseated,
+                requeued=len(queue),
+                stranded=stranded,
+                rounds=self.enlist(queue)
+            ))
+            closing = self.closing(
+                section
+                    for section_ in closing
+                    for section in children[section_.parent]
+            )
+        return repairs
+
+
+enlist_agent = EnlistAgent()
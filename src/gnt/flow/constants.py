@@ -0,0 +1 @@
+UNPLACED = 10 ** 6
@@ -0,0 +1,458 @@
+from src.gnt.flow.constants import *
+
+from src.cls.main        import Student
+from src.cls.main        import Subject
+from src.cls.main        import Category
+from src.cls.main        import Section
+from src.cls.main        import Shift
+from src.cls.main        import Reason
+from src.cls.constants   import INF
+from src.gnt.enlist.main import EnlistAgent
+from src.gnt.enlist.main import Round
+from collections         import Counter
+from heapq               import heappush
+from heapq               import heappop
+from time                import perf_counter
+from typing              import Iterable
+
+
+class Network:
+    def __init__(self) -> None:
+        self._targets    = list[int]()
+        self._capacities = list[int]()
+        self._costs      = list[int]()
+        self._edges      = list[list[int]]()
+
+    def node(self) -> int:
+        self._edges.append(list())
+        return len(self._edges) - 1
+
+    def edge(
+        self,
+        source  : int,
+        target  : int,
+        capacity: int,
+        cost    : int
+    ) -> int:
+        edge = len(self._targets)
+        for node, target_, capacity_, cost_ in (
+            (source, target, capacity, cost),
+            (target, source, 0, -cost)
+        ):
+            self._edges[node].append(len(self._targets))
+            self._targets.append(target_)
+            self._capacities.append(capacity_)
+            self._costs.append(cost_)
+        return edge
+
+    def flow(self, edge: int) -> int:
+        return self._capacities[edge ^ 1]
+
+    def solve(
+        self,
+        source: int,
+        sink  : int
+    ) -> tuple[int, int]:
+        potentials = [0] * len(self._edges)
+        flow       = 0
+        cost       = 0
+        while self.price(source, sink, potentials):
+            while True:
+                levels = self.levels(source, sink, potentials)
+                if levels[sink] < 0:
+                    break
+                amount, cost_ = self.augment(source, sink, potentials, levels)
+                if not amount:
+                    break
+                flow += amount
+                cost += cost_
+        return flow, cost
+
+    def reduced(
+        self,
+        edge      : int,
+        potentials: list[int]
+    ) -> int:
+        return self._costs[edge] + potentials[self._targets[edge ^ 1]] - potentials[self._targets[edge]]
+
+    def price(
+        self,
+        source    : int,
+        sink      : int,
+        potentials: list[int]
+    ) -> bool:
+        distances = [INF] * len(self._edges)
+        distances[source] = 0
+        heap = [(0, source)]
+        while heap:
+            distance, node = heappop(heap)
+            if distance > distances[node]:
+                continue
+            for edge in self._edges[node]:
+                if self._capacities[edge] <= 0:
+                    continue
+                target    = self._targets[edge]
+                distance_ = distance + self.reduced(edge, potentials)
+                if distance_ < distances[target]:
+                    distances[target] = distance_
+                    heappush(heap, (distance_, target))
+        for node, distance in enumerate(distances):
+            if distance < INF:
+                potentials[node] += distance
+        return distances[sink] < INF
+
+    def levels(
+        self,
+        source    : int,
+        sink      : int,
+        potentials: list[int]
+    ) -> list[int]:
+        levels = [-1] * len(self._edges)
+        levels[source] = 0
+        queue = [source]
+        for node in queue:
+            for edge in self._edges[node]:
+                target = self._targets[edge]
+                if levels[target] < 0 and self._capacities[edge] > 0 and not self.reduced(edge, potentials):
+                    levels[target] = levels[node] + 1
+                    queue.append(target)
+        return levels
+
+    def augment(
+        self,
+        source    : int,
+        sink      : int,
+        potentials: list[int],
+        levels    : list[int]
+    ) -> tuple[int, int]:
+        arcs   = [0] * len(self._edges)
+        flow   = 0
+        cost   = 0
+        while True:
+            path = list[int]()
+            node = source
+            while node != sink:
+                edges = self._edges[node]
+                while arcs[node] < len(edges):
+                    edge   = edges[arcs[node]]
+                    target = self._targets[edge]
+                    if (
+                        self._capacities[edge] > 0
+                        and levels[target] == levels[node] + 1
+                        and not self.reduced(edge, potentials)
+                    ):
+                        break
+                    arcs[node] += 1
+                if arcs[node] == len(edges):
+                    if node == source:
+                        return flow, cost
+                    levels[node] = -1
+                    edge = path.pop()
+                    node = self._targets[edge ^ 1]
+                    arcs[node] += 1
+                else:
+                    path.append(edges[arcs[node]])
+                    node = self._targets[edges[arcs[node]]]
+            amount = min(self._capacities[edge] for edge in path)
+            for edge in path:
+                self._capacities[edge]     -= amount
+                self._capacities[edge ^ 1] += amount
+                cost += amount * self._costs[edge]
+            flow += amount
+
+
+class FlowAgent:
+    def constrained(
+        self,
+        student: Student,
+        type   : str
+    ) -> bool:
+        choices = student.rankings.final.all(type)
+        return any(
+            group.required and group.parent.sections and group.parent in choices
+                for group in student.memberships
+        )
+
+    def eligible(
+        self,
+        student: Student,
+        object : Subject | Category
+    ) -> bool:
+        if object in student.attends:
+            return False
+        elif object.closed:
+            return False
+        elif isinstance(object, Subject) and student.grade_level not in object.teaches:
+            return False
+        else:
+            return object.ok_student(student)
+
+    def key(
+        self,
+        student: Student,
+        types  : tuple[str, ...]
+    ) -> tuple:
+        return (
+            student.grade_level,
+            student.shift,
+            types,
+            tuple(tuple(student.rankings.final.all(type)) for type in types),
+            student.taken_mask,
+            student.attends_mask,
+            frozenset(student.sessions)
+        )
+
+    def classes(self, units: list[tuple[Student, str]]) -> dict[tuple, list[Student]]:
+        pending = dict[Student, list[str]]()
+        for student, type in units:
+            pending.setdefault(student, list()).append(type)
+        classes = dict[tuple, list[Student]]()
+        for student, types in pending.items():
+            classes.setdefault(self.key(student, tuple(types)), list()).append(student)
+        return classes
+
+    def groups(
+        self,
+        student: Student,
+        object : Subject | Category
+    ) -> dict[tuple[str, Shift] | None, list[Section] | None]:
+        if not object.sections:
+            return {None: None}
+        groups = dict[tuple[str, Shift] | None, list[Section] | None]()
+        for section in object.fitting(student):
+            groups.setdefault((section.parallel_session.partition, section.shift), list()).append(section)
+        return groups
+
+    def network(self, classes: dict[tuple, list[Student]]) -> tuple[Network, dict[tuple, tuple]]:
+        network = Network()
+        source  = network.node()
+        sink    = network.node()
+        targets = dict[tuple, int]()
+        edges   = dict[tuple, tuple]()
+        for key, members in classes.items():
+            student = members[0]
+            types   = key[2]
+            size    = len(members)
+            node    = network.node()
+            shared  = set(
+                object
+                    for object, count in Counter(
+                        object
+                            for type in types
+                            for object in student.rankings.final.all(type)
+                    ).items()
+                    if count > 1
+            )
+            objects = dict[Subject | Category, int | None]()
+            choices = dict[str, list[tuple[Subject | Category, int]]]()
+            pools   = dict[Subject | Category, list[tuple[list[Section] | None, int]]]()
+            for type in types:
+                type_ = network.node()
+                network.edge(node, type_, size, 0)
+                network.edge(type_, sink, size, UNPLACED)
+                choices[type] = list()
+                for rank, object in enumerate(student.rankings.final.all(type)):
+                    if object not in objects:
+                        groups = self.groups(student, object) if self.eligible(student, object) else None
+                        if not groups:
+                            objects[object] = None
+                            continue
+                        outlet = network.node()
+                        if object in shared:
+                            objects[object] = network.node()
+                            network.edge(objects[object], outlet, size, 0)
+                        else:
+                            objects[object] = outlet
+                        pools[object] = list()
+                        for group, sections in groups.items():
+                            if (object, group) not in targets:
+                                targets[(object, group)] = network.node()
+                                network.edge(
+                                    targets[(object, group)],
+                                    sink,
+                                    object.capacity.available if sections is None else sum(
+                                        section.capacity.available
+                                            for section in sections
+                                    ),
+                                    0
+                                )
+                            pools[object].append((sections, network.edge(outlet, targets[(object, group)], size, 0)))
+                    if objects[object] is not None:
+                        choices[type].append((object, network.edge(type_, objects[object], size, rank)))
+            partitions = set(
+                group[0]
+                    for object in pools
+                    for group in self.groups(student, object)
+                    if group is not None
+            )
+            loose      = sum(
+                any(not object.sections for object, edge in choices[type])
+                    for type in types
+            )
+            network.edge(source, node, size * min(len(types), len(partitions) + loose), 0)
+            edges[key] = (choices, pools)
+        network.solve(source, sink)
+        return network, edges
+
+    def options(
+        self,
+        student: Student,
+        object : Subject | Category,
+        pool   : list[tuple[list[Section] | None, int]],
+        seats  : dict[int, int]
+    ) -> list[Section | None]:
+        if not object.sections:
+            return [None]
+        planned  = set(
+            section
+                for sections, edge in pool
+                if seats[edge]
+                for section in sections
+        )
+        options  = dict[str, Section]()
+        for section in sorted(
+            object.fitting(student),
+            key=lambda section: (section not in planned, section.capacity.filled - section.capacity.ideal)
+        ):
+            options.setdefault(section.parallel_session.partition, section)
+        return list(options.values())
+
+    def combine(
+        self,
+        options: list[list[Section | None]],
+        taken  : frozenset[str] = frozenset()
+    ) -> tuple[int, list[Section | None | bool]]:
+        if not options:
+            return 0, list()
+        best = None
+        for section in options[0]:
+            partition = None if section is None else section.parallel_session.partition
+            if partition in taken:
+                continue
+            count, picks = self.combine(options[1:], taken if partition is None else taken | {partition})
+            if best is None or count + 1 > best[0]:
+                best = (count + 1, [section] + picks)
+            if best[0] == len(options):
+                return best
+        count, picks = self.combine(options[1:], taken)
+        if best is None or count > best[0]:
+            best = (count, [False] + picks)
+        return best
+
+    def reason(
+        self,
+        student: Student,
+        object : Subject | Category
+    ) -> Reason:
+        if object.closed:
+            return Reason.CLOSED
+        else:
+            return object.screen(student) or Reason.SECTIONS
+
+    def place(
+        self,
+        student: Student,
+        type   : str,
+        object : Subject | Category,
+        section: Section | None
+    ) -> bool:
+        final = student.rankings.final
+        for index in range(final.all(type).index(object)):
+            final.reject(type, self.reason(student, final.get(type)))
+        if isinstance(object, Subject):
+            qualified, reason = student.add_subject(type, object, None if section is None else [section])
+        else:
+            qualified, reason = student.add_category(type, object, None if section is None else [section])
+        return qualified
+
+    def assign(self, units: list[tuple[Student, str]]) -> tuple[Round, list[tuple[Student, str]]]:
+        start          = perf_counter()
+        classes        = self.classes(units)
+        network, edges = self.network(classes)
+        placed         = 0
+        deferred       = list[tuple[Student, str]]()
+        for key, members in classes.items():
+            choices, pools = edges[key]
+            counts = dict(
+                ((type, object), network.flow(edge))
+                    for type in choices
+                    for object, edge in choices[type]
+            )
+            seats  = dict(
+                (edge, network.flow(edge))
+                    for pool in pools.values()
+                    for sections, edge in pool
+            )
+            for student in members:
+                picks = list[tuple[str, Subject | Category]]()
+                for type in key[2]:
+                    object = next(
+                        (
+                            object
+                                for object, edge in choices[type]
+                                if counts[(type, object)]
+                                and all(object != object_ for type_, object_ in picks)
+                        ),
+                        None
+                    )
+                    if object is None:
+                        deferred.append((student, type))
+                    else:
+                        picks.append((type, object))
+                count, sections = self.combine([
+                    self.options(student, object, pools[object], seats)
+                        for type, object in picks
+                ])
+                for (type, object), section in zip(picks, sections):
+                    if section is False or not self.place(student, type, object, section):
+                        deferred.append((student, type))
+                        continue
+                    placed                  += 1
+                    counts[(type, object)] -= 1
+                    for sections_, edge in pools[object]:
+                        if seats[edge] and (sections_ is None or section in sections_):
+                            seats[edge] -= 1
+                            break
+        return Round(
+            index=1,
+            proposals=len(units),
+            accepted=placed,
+            rejected=len(deferred),
+            elapsed=perf_counter() - start
+        ), deferred
+
+    def enlist(self, students: Iterable[Student]) -> list[Round]:
+        units       = [
+            (student, type)
+                for student in sorted(students, key=str)
+                for type in sorted(student.grade_level.to_rank)
+                if student.subjects.get(type) is None
+                and student.categories.get(type) is None
+                and student.rankings.final.count(type)
+        ]
+        constrained = [student for student, type in units if self.constrained(student, type)]
+        units       = [(student, type) for student, type in units if not self.constrained(student, type)]
+
+        rounds = list[Round]()
+        while units:
+            round, units = self.assign(units)
+            rounds.append(round)
+            if not round.accepted:
+                break
+        rounds.extend(EnlistAgent().enlist(dict.fromkeys(
+            constrained + [student for student, type in units]
+        )))
+        return [
+            Round(
+                index=index + 1,
+                proposals=round.proposals,
+                accepted=round.accepted,
+                rejected=round.rejected,
+                exhausted=round.exhausted,
+                elapsed=round.elapsed
+            )
+                for index, round in enumerate(rounds)
+        ]
+
+
+flow_agent = FlowAgent()
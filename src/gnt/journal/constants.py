@@ -0,0 +1,21 @@
+JOURNAL    = 'journal.tsv'
+CHECKPOINT = 'checkpoint.bin'
+ORIGIN     = 'origin.bin'
+TEMPORARY  = '.tmp'
+
+EVERY = 1
+NONE  = -1
+
+ACCEPT = 'A'
+BLOCK  = 'B'
+REJECT = 'R'
+COMMIT = 'C'
+
+DELIMITER = '\t'
+NEWLINE   = b'\n'
+MEMBER    = ';'
+ENCODING  = 'utf-8'
+
+CHECKPOINT_MAGIC   = b'RESABJ'
+CHECKPOINT_VERSION = 3
+CHECKPOINT_HEADER  = '>6sHQQ'
@@ -0,0 +1,266 @@
+from src.gnt.journal.constants import *
+
+from src.cls.main         import Student
+from src.cls.main         import Section
+from src.cls.main         import Subject
+from src.cls.main         import Category
+from src.cls.main         import Reason
+from src.gnt.encode.main  import EncodeAgent
+from pickle               import dumps
+from pickle               import loads
+from pickle               import HIGHEST_PROTOCOL
+from struct               import calcsize
+from struct               import pack
+from struct               import unpack
+from os                   import fsync
+from os                   import makedirs
+from os                   import replace
+from os.path              import exists
+from os.path              import join
+from typing               import Iterable
+
+
+class Journal:
+    def __init__(
+        self,
+        path        : str,
+        encode_agent: EncodeAgent,
+        students    : Iterable[Student],
+        every       : int = None,
+        round       : int = None
+    ) -> None:
+        self._path         = path
+        self._encode_agent = encode_agent
+        self._students     = list(students)
+        self._every        = every or EVERY
+        self._round        = round or int()
+        self._file         = open(join(path, JOURNAL), 'ab')
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def encode_agent(self) -> EncodeAgent:
+        return self._encode_agent
+
+    @property
+    def students(self) -> list[Student]:
+        return self._students
+
+    @property
+    def every(self) -> int:
+        return self._every
+
+    @property
+    def round(self) -> int:
+        return self._round
+
+    def write(self, *fields: object) -> None:
+        self._file.write(DELIMITER.join(map(str, fields)).encode(ENCODING) + NEWLINE)
+
+    def accept(
+        self,
+        student: Student,
+        type   : str,
+        subject: Subject | Category,
+        section: Section | None
+    ) -> None:
+        self.write(
+            ACCEPT,
+            self.round + 1,
+            student.index,
+            student.id,
+            type,
+            subject.index,
+            subject,
+            NONE if section is None else section.index,
+            '' if section is None else section,
+            ''
+        )
+
+    def block(
+        self,
+        members: list[tuple[Student, str]],
+        subject: Subject | Category,
+        section: Section
+    ) -> None:
+        self.write(
+            BLOCK,
+            self.round + 1,
+            MEMBER.join(str(student.index) for student, type in members),
+            MEMBER.join(student.id for student, type in members),
+            MEMBER.join(type for student, type in members),
+            subject.index,
+            subject,
+            section.index,
+            section,
+            ''
+        )
+
+    def reject(
+        self,
+        student: Student,
+        type   : str,
+        subject: Subject | Category
+    ) -> None:
+        self.write(
+            REJECT,
+            self.round + 1,
+            student.index,
+            student.id,
+            type,
+            subject.index,
+            subject,
+            NONE,
+            '',
+            student.rankings.final.last(type).name
+        )
+
+    def commit(self) -> None:
+        self._round += 1
+        self.write(COMMIT, self.round)
+        self._file.flush()
+        fsync(self._file.fileno())
+        if self.round % self.every == 0:
+            self.checkpoint(CHECKPOINT)
+
+    def checkpoint(self, name: str) -> None:
+        path = join(self.path, name)
+        with open(path + TEMPORARY, 'wb') as file:
+            file.write(pack(
+                CHECKPOINT_HEADER,
+                CHECKPOINT_MAGIC,
+                CHECKPOINT_VERSION,
+                self.round,
+                self._file.tell()
+            ))
+            file.write(dumps(
+                ([student.index for student in self.students], self.encode_agent.freeze()),
+                HIGHEST_PROTOCOL
+            ))
+            file.flush()
+            fsync(file.fileno())
+        replace(path + TEMPORARY, path)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class JournalAgent:
+    def exists(self, path: str) -> bool:
+        return exists(join(path, CHECKPOINT)) and exists(join(path, JOURNAL))
+
+    def open(
+        self,
+        path        : str,
+        encode_agent: EncodeAgent,
+        students    : Iterable[Student],
+        every       : int = None
+    ) -> Journal:
+        makedirs(path, exist_ok=True)
+        open(join(path, JOURNAL), 'wb').close()
+        journal = Journal(path, encode_agent, students, every)
+        journal.checkpoint(ORIGIN)
+        journal.checkpoint(CHECKPOINT)
+        return journal
+
+    def load(
+        self,
+        path        : str,
+        encode_agent: EncodeAgent
+    ) -> tuple[int, int, list[Student]]:
+        with open(path, 'rb') as file:
+            header = file.read(calcsize(CHECKPOINT_HEADER))
+            if len(header) < calcsize(CHECKPOINT_HEADER):
+                raise Exception()
+            magic, version, round, offset = unpack(CHECKPOINT_HEADER, header)
+            if magic != CHECKPOINT_MAGIC or version != CHECKPOINT_VERSION:
+                raise Exception()
+            order, state = loads(file.read())
+        encode_agent.thaw(state)
+        return round, offset, [encode_agent.roster[index] for index in order]
+
+    def scan(
+        self,
+        path  : str,
+        offset: int
+    ) -> tuple[list[list[str]], int, int]:
+        with open(join(path, JOURNAL), 'rb') as file:
+            file.seek(offset)
+            data = file.read()
+        events    = list[list[str]]()
+        committed = list[list[str]]()
+        round     = None
+        position  = offset
+        for line in data.split(NEWLINE)[:-1]:
+            fields    = line.decode(ENCODING).split(DELIMITER)
+            position += len(line) + len(NEWLINE)
+            if fields[0] == COMMIT:
+                committed.extend(events)
+                events.clear()
+                round  = int(fields[1])
+                offset = position
+            else:
+                events.append(fields)
+        return committed, offset, round
+
+    def apply(
+        self,
+        encode_agent: EncodeAgent,
+        fields      : list[str]
+    ) -> None:
+        kind, round, student, id, type, subject, name, section, label, reason = fields
+        subject = encode_agent.catalog[int(subject)]
+        if kind == BLOCK:
+            subject.seat_block(
+                [
+                    (encode_agent.roster[int(index)], type_)
+                        for index, type_ in zip(student.split(MEMBER), type.split(MEMBER))
+                ],
+                encode_agent.sections[int(section)]
+            )
+            return
+        student = encode_agent.roster[int(student)]
+        if kind == REJECT:
+            if student.rankings.final.get(type) != subject:
+                raise Exception()
+            student.rankings.final.reject(type, Reason[reason])
+            return
+        sections = None if int(section) == NONE else [encode_agent.sections[int(section)]]
+        if isinstance(subject, Subject):
+            qualified, reason = student.add_subject(type, subject, sections)
+        else:
+            qualified, reason = student.add_category(type, subject, sections)
+        if not qualified:
+            raise Exception(reason)
+
+    def resume(
+        self,
+        path        : str,
+        encode_agent: EncodeAgent,
+        every       : int = None
+    ) -> tuple[Journal, list[Student]]:
+        round, offset, students = self.load(join(path, CHECKPOINT), encode_agent)
+        events, offset, round_  = self.scan(path, offset)
+        for fields in events:
+            self.apply(encode_agent, fields)
+        with open(join(path, JOURNAL), 'r+b') as file:
+            file.truncate(offset)
+        if round_ is not None:
+            round = round_
+        return Journal(path, encode_agent, students, every, round), students
+
+    def replay(
+        self,
+        path        : str,
+        encode_agent: EncodeAgent
+    ) -> int:
+        round, offset, students = self.load(join(path, ORIGIN), encode_agent)
+        events, offset, round   = self.scan(path, offset)
+        for fields in events:
+            self.apply(encode_agent, fields)
+        return len(events)
+
+
+journal_agent = JournalAgent()
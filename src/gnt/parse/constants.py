@@ -6,4 +6,6 @@ REQUEST      = 'Request description'
 PATHS = {
     SUBJECT_DESC: 'src\\txt\\subject_file.txt',
     REQUEST:      'src\\txt\\request.txt'
-}
\ No newline at end of file
+}
+
+SNAPSHOT = 'input\\Encoded.snapshot'
\ No newline at end of file
@@ -1,20 +1,35 @@
 from src.gnt.parse.constants import *
 
-from src.gnt.encode.main import encode_agent
+from src.gnt.encode.main      import encode_agent
+from src.gnt.enlist.main      import enlist_agent
+from src.gnt.eligibility.main import eligibility_agent
+from src.gnt.simulate.main    import simulate_agent
+from src.gnt.flow.main        import flow_agent
+from src.gnt.bulk.main        import bulk_agent
+from src.gnt.shard.main       import shard_agent
+from src.gnt.journal.main     import journal_agent
+from src.gnt.plot.main        import plot_agent
+from src.gnt.analyze.main     import analyze_agent
 
 
 class ParseAgent:
     def terminal(self) -> None:
         subjects_encoded = False
+        blank_state      = encode_agent.freeze()
+        subjects_state   = None
+        students_state   = None
 
         def encode_subjects() -> None:
-            nonlocal subjects_encoded
+            nonlocal subjects_encoded, subjects_state, students_state
             with open(PATHS[SUBJECT_DESC], 'r') as file:
                 for line in file.readlines():
                     print(line, end='')
             subject_path = input('Subject data file path: ')
+            encode_agent.thaw(blank_state)
             encode_agent.encode_subjects(subject_path)
             subjects_encoded = True
+            subjects_state   = encode_agent.freeze()
+            students_state   = None
 
         def check_subjects() -> None:
             if subjects_encoded:
@@ -24,6 +39,23 @@ class ParseAgent:
             else:
                 encode_subjects()
 
+        def encode_students() -> None:
+            nonlocal students_state
+            student_path = input('Student data file path: ')
+            encode_agent.thaw(subjects_state)
+            encode_agent.encode_students(student_path)
+            students_state = encode_agent.freeze()
+
+        def check_students() -> None:
+            if students_state is not None:
+                reencode = input('Re-encode students? (Y/N): ').upper() == 'Y'
+                if reencode:
+                    encode_students()
+                else:
+                    encode_agent.thaw(students_state)
+            else:
+                encode_students()
+
         def validate() -> None:
             check_subjects()
 
@@ -36,6 +68,72 @@ class ParseAgent:
         def read() -> None:
             check_subjects()
 
+        def enlist() -> None:
+            check_subjects()
+            check_students()
+            students = [
+                student
+                    for students in encode_agent.students.values()
+                    for student in students
+            ]
+            optimal  = input('Optimal assignment? (Y/N): ').upper() == 'Y'
+            if optimal:
+                rounds = flow_agent.enlist(students)
+            elif input('Place identical students in bulk? (Y/N): ').upper() == 'Y':
+                rounds = bulk_agent.enlist(students)
+            elif input('Solve independent shards in parallel? (Y/N): ').upper() == 'Y':
+                rounds = shard_agent.enlist(encode_agent, students)
+            else:
+                journal_path = input('Journal directory (blank for none): ')
+                journal      = None
+                if journal_path:
+                    if journal_agent.exists(journal_path) and input('Resume interrupted run? (Y/N): ').upper() == 'Y':
+                        journal, students = journal_agent.resume(journal_path, encode_agent)
+                    else:
+                        journal = journal_agent.open(journal_path, encode_agent, students)
+                rounds = enlist_agent.enlist(
+                    students,
+                    eligibility_agent.build(students, encode_agent.sections),
+                    journal=journal
+                )
+                if journal is not None:
+                    journal.close()
+            for round in rounds:
+                print(round)
+            repair = input('Close sections below minimum? (Y/N): ').upper() == 'Y'
+            if repair:
+                for repair in enlist_agent.repair(encode_agent.sections):
+                    print(repair)
+                    for row in repair.rows():
+                        print(row)
+
+        def analyze() -> None:
+            check_subjects()
+            check_students()
+            analysis = analyze_agent.analyze(encode_agent)
+            print(analysis)
+            for row in analysis.rows():
+                print(row)
+            for pair in analysis.pairs():
+                print(pair)
+
+        def plot() -> None:
+            check_subjects()
+            check_students()
+            minimum = int(input('Minimum section capacity: '))
+            ideal   = int(input('Ideal section capacity: '))
+            maximum = int(input('Maximum section capacity: '))
+            plotted = plot_agent.plot(encode_agent, minimum, ideal, maximum)
+            print(plotted)
+            output_path = input('Output subject data file path: ')
+            plot_agent.write(output_path, plotted, encode_agent)
+
+        def simulate() -> None:
+            check_subjects()
+            check_students()
+            runs = int(input('Number of runs: '))
+            print(simulate_agent.simulate(encode_agent, runs))
+
         def main() -> None:
             with open(PATHS[REQUEST], 'r') as file:
                 for line in file.readlines():
@@ -48,6 +146,14 @@ class ParseAgent:
                     read()
                 case 'VALIDATE':
                     validate()
+                case 'ANALYZE':
+                    analyze()
+                case 'PLOT':
+                    plot()
+                case 'ENLIST':
+                    enlist()
+                case 'SIMULATE':
+                    simulate()
 
         run_again = True
         while run_again:
@@ -58,6 +164,9 @@ class ParseAgent:
 if __name__ == '__main__':
     parse_agent = ParseAgent()
     if TERMINAL:
-        encode_agent.encode_subjects('input\\Test data_ Subjects.xlsx')
-        encode_agent.encode_students('input\\Test data_ Students.xlsx')
+        encode_agent.encode(
+            'input\\Test data_ Subjects.xlsx',
+            'input\\Test data_ Students.xlsx',
+            SNAPSHOT
+        )
         print('mlem')  # Just for breakpoint purposes
\ No newline at end of file
@@ -0,0 +1,9 @@
+PASSES  = 20
+EPSILON = 1e-9
+
+SECTIONS = 'Sections'
+NAME     = 'Name'
+COUNT    = 'Count'
+FIELDS   = ('Type', 'Index', 'Shift', 'Min capacity', 'Ideal capacity', 'Max capacity')
+
+PLOT_TEMPLATE = 'Plot: {} sections over {} partitions, {:.2f} conflict weight ({:.3f}s)'
\ No newline at end of file
@@ -0,0 +1,303 @@
+from src.gnt.plot.constants import *
+
+from src.cls.main        import Student
+from src.cls.main        import Subject
+from src.cls.main        import Category
+from src.cls.main        import Shift
+from src.gnt.encode.main import EncodeAgent
+from src.gnt.read.main   import read_agent
+from src.gnt.write.main  import writer_agent
+from itertools           import combinations
+from math                import ceil
+from os.path             import exists
+from time                import perf_counter
+from typing              import Any
+from typing              import Iterable
+
+
+class Plot:
+    def __init__(
+        self,
+        sections : dict[Subject | Category, list[tuple[str, Shift]]],
+        capacity : tuple[int, int, int],
+        conflicts: float = None,
+        elapsed  : float = None
+    ) -> None:
+        self._sections  = sections
+        self._capacity  = capacity
+        self._conflicts = conflicts or float()
+        self._elapsed   = elapsed or float()
+
+    def __repr__(self) -> str:
+        return PLOT_TEMPLATE.format(
+            self.count,
+            len(set(
+                partition
+                    for sections in self.sections.values()
+                    for partition, shift in sections
+            )),
+            self.conflicts,
+            self.elapsed
+        )
+
+    @property
+    def sections(self) -> dict[Subject | Category, list[tuple[str, Shift]]]:
+        return self._sections
+
+    @property
+    def capacity(self) -> tuple[int, int, int]:
+        return self._capacity
+
+    @property
+    def conflicts(self) -> float:
+        return self._conflicts
+
+    @property
+    def elapsed(self) -> float:
+        return self._elapsed
+
+    @property
+    def count(self) -> int:
+        return sum(len(sections) for sections in self.sections.values())
+
+
+class PlotAgent:
+    def colors(self, shifts: Iterable[Shift]) -> list[tuple[str, Shift]]:
+        colors = dict[str, Shift]()
+        for shift in shifts:
+            for partition in sorted(shift.partitions):
+                colors.setdefault(partition, shift)
+        return list(colors.items())
+
+    def profiles(self, students: Iterable[Student]) -> dict[tuple, int]:
+        profiles = dict[tuple, int]()
+        for student in students:
+            key = tuple(
+                (type, tuple(student.rankings.initial.all(type)))
+                    for type in sorted(student.grade_level.to_rank)
+            )
+            profiles[key] = profiles.get(key, 0) + 1
+        return profiles
+
+    def demand(
+        self,
+        profiles: dict[tuple, int]
+    ) -> tuple[dict[Subject | Category, int], dict[Subject | Category, dict[Subject | Category, float]]]:
+        demand = dict[Subject | Category, int]()
+        graph  = dict[Subject | Category, dict[Subject | Category, float]]()
+        for key, count in profiles.items():
+            choices = list[tuple[str, Subject | Category, float]]()
+            for type, ranked in key:
+                for rank, object in enumerate(ranked):
+                    demand[object] = demand.get(object, 0) + (count if not rank else 0)
+                    choices.append((type, object, 1 / (rank + 1)))
+            for (type, object, weight), (type_, object_, weight_) in combinations(choices, 2):
+                if type == type_ or object == object_:
+                    continue
+                weight *= weight_ * count
+                edges   = graph.setdefault(object, dict())
+                edges_  = graph.setdefault(object_, dict())
+                edges[object_] = edges.get(object_, 0) + weight
+                edges_[object] = edges_.get(object, 0) + weight
+        return demand, graph
+
+    def counts(
+        self,
+        demand: dict[Subject | Category, int],
+        ideal : int
+    ) -> dict[Subject | Category, int]:
+        return dict(
+            (object, max(1, ceil(count / ideal)))
+                for object, count in demand.items()
+        )
+
+    def overflow(
+        self,
+        count : int,
+        total : int,
+        count_: int,
+        total_: int
+    ) -> float:
+        return max(float(), count / total + count_ / total_ - 1)
+
+    def delta(
+        self,
+        graph : dict[Subject | Category, dict[Subject | Category, float]],
+        counts: dict[Subject | Category, int],
+        placed: dict[Subject | Category, list[int]],
+        object: Subject | Category,
+        source: int | None,
+        target: int
+    ) -> float:
+        row   = placed[object]
+        total = counts[object]
+        delta = float()
+        for neighbor, weight in graph.get(object, dict()).items():
+            row_   = placed[neighbor]
+            total_ = counts[neighbor]
+            for color, change in ((source, -1), (target, 1)):
+                if color is None or not row_[color]:
+                    continue
+                delta += weight * (
+                    self.overflow(row[color] + change, total, row_[color], total_)
+                    - self.overflow(row[color], total, row_[color], total_)
+                )
+        return delta
+
+    def cost(
+        self,
+        graph : dict[Subject | Category, dict[Subject | Category, float]],
+        counts: dict[Subject | Category, int],
+        placed: dict[Subject | Category, list[int]]
+    ) -> float:
+        return sum(
+            weight * self.overflow(count, counts[object], count_, counts[neighbor])
+                for object, edges in graph.items()
+                if object in placed
+                for neighbor, weight in edges.items()
+                if neighbor in placed
+                for count, count_ in zip(placed[object], placed[neighbor])
+        ) / 2
+
+    def solve(
+        self,
+        graph : dict[Subject | Category, dict[Subject | Category, float]],
+        counts: dict[Subject | Category, int],
+        colors: int
+    ) -> dict[Subject | Category, list[int]]:
+        placed = dict((object, [0] * colors) for object in counts)
+        loads  = [0] * colors
+        order  = sorted(
+            counts,
+            key=lambda object: (-sum(graph.get(object, dict()).values()), str(object))
+        )
+        for object in order:
+            row = placed[object]
+            for section in range(counts[object]):
+                color = min(
+                    range(colors),
+                    key=lambda color: (
+                        round(self.delta(graph, counts, placed, object, None, color), 9),
+                        row[color],
+                        loads[color],
+                        color
+                    )
+                )
+                row[color]   += 1
+                loads[color] += 1
+
+        for index in range(PASSES):
+            moved = False
+            for object in order:
+                row = placed[object]
+                for source in range(colors):
+                    while row[source]:
+                        delta, spread, target = min(
+                            (
+                                self.delta(graph, counts, placed, object, source, target),
+                                row[target] + 1 - row[source],
+                                target
+                            )
+                                for target in range(colors)
+                                if target != source
+                        )
+                        if delta < -EPSILON or (delta < EPSILON and spread < 0):
+                            row[source]   -= 1
+                            row[target]   += 1
+                            loads[source] -= 1
+                            loads[target] += 1
+                            moved = True
+                        else:
+                            break
+            if not moved:
+                break
+        return placed
+
+    def plot(
+        self,
+        encode_agent: EncodeAgent,
+        minimum     : int,
+        ideal       : int,
+        maximum     : int
+    ) -> Plot:
+        start         = perf_counter()
+        colors        = self.colors(encode_agent.shifts.values())
+        demand, graph = self.demand(self.profiles(encode_agent.roster))
+        counts        = self.counts(demand, ideal)
+        placed        = self.solve(graph, counts, len(colors))
+        return Plot(
+            sections=dict(
+                (object, [
+                    colors[color]
+                        for color, count in enumerate(placed[object])
+                        for section in range(count)
+                ])
+                    for object in encode_agent.catalog
+                    if object in placed
+            ),
+            capacity=(minimum, ideal, maximum),
+            conflicts=self.cost(graph, counts, placed),
+            elapsed=perf_counter() - start
+        )
+
+    def existing(
+        self,
+        path        : str,
+        encode_agent: EncodeAgent
+    ) -> dict[Subject | Category, list[Any]]:
+        existing = dict[Subject | Category, list[Any]]()
+        if not exists(path) or SECTIONS not in read_agent.get_sheetnames(path, encode_agent.engine):
+            return existing
+        data = encode_agent.xlsx(path, SECTIONS)
+        for r in range(2, len(data)):
+            count = int(data[r][1] or 0)
+            existing[encode_agent.find(data[r][0])] = list(data[r][:2 + len(FIELDS) * count])
+        return existing
+
+    def rows(
+        self,
+        plot    : Plot,
+        objects : Iterable[Subject | Category],
+        existing: dict[Subject | Category, list[Any]] = None
+    ) -> list[list[Any]]:
+        existing = existing or dict()
+        width    = max(
+            [len(sections) for sections in plot.sections.values()]
+            + [int(row[1] or 0) for object, row in existing.items() if object not in plot.sections],
+            default=0
+        )
+        rows     = [
+            [NAME, COUNT] + [
+                value
+                    for index in range(width)
+                    for value in (index + 1,) + (None,) * (len(FIELDS) - 1)
+            ],
+            [None, None] + list(FIELDS) * width
+        ]
+        for object in objects:
+            if object not in plot.sections and object in existing:
+                rows.append(existing[object])
+                continue
+            sections = plot.sections.get(object, list())
+            indices  = dict[str, int]()
+            row      = [object, len(sections)]
+            for partition, shift in sections:
+                indices[partition] = indices.get(partition, 0) + 1
+                row.extend((partition, indices[partition], shift) + plot.capacity)
+            rows.append(row)
+        return rows
+
+    def write(
+        self,
+        path        : str,
+        plot        : Plot,
+        encode_agent: EncodeAgent
+    ) -> None:
+        writer_agent.write_to_xlsx(
+            path,
+            SECTIONS,
+            self.rows(plot, encode_agent.catalog, self.existing(path, encode_agent))
+        )
+
+
+plot_agent = PlotAgent()
\ No newline at end of file
@@ -0,0 +1,32 @@
+READ_ONLY = True
+DATA_ONLY = True
+
+OPENPYXL = 'openpyxl'
+XML      = 'xml'
+ENGINE   = OPENPYXL
+
+MAIN          = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+RELATIONSHIPS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+REFERENCE     = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+
+WORKBOOK_PART   = 'xl/workbook.xml'
+OFFICE_DOCUMENT = '/officeDocument'
+SHARED_STRINGS  = '/sharedStrings'
+STYLES          = '/styles'
+
+SHEET      = f'{MAIN}sheet'
+DIMENSION  = f'{MAIN}dimension'
+ROW        = f'{MAIN}row'
+CELL       = f'{MAIN}c'
+VALUE      = f'{MAIN}v'
+TEXT       = f'{MAIN}t'
+RUN        = f'{MAIN}r'
+STRING     = f'{MAIN}si'
+INLINE     = f'{MAIN}is'
+WORKBOOK   = f'{MAIN}workbookPr'
+NUMBER_FMT = f'{MAIN}numFmt'
+CELL_XFS   = f'{MAIN}cellXfs'
+RELATION   = f'{RELATIONSHIPS}Relationship'
+
+ESCAPE  = 'x005F_'
+INVALID = '#VALUE!'
@@ -0,0 +1,280 @@
+from src.gnt.read.constants import *
+
+from openpyxl                import load_workbook
+from openpyxl.workbook       import Workbook
+from openpyxl.styles.numbers import BUILTIN_FORMATS
+from openpyxl.styles.numbers import is_date_format
+from openpyxl.styles.numbers import is_timedelta_format
+from openpyxl.utils.datetime import from_excel
+from openpyxl.utils.datetime import from_ISO8601
+from openpyxl.utils.datetime import MAC_EPOCH
+from openpyxl.utils.datetime import WINDOWS_EPOCH
+from openpyxl.utils.cell     import range_boundaries
+from xml.etree.ElementTree   import Element
+from xml.etree.ElementTree   import fromstring
+from xml.etree.ElementTree   import iterparse
+from posixpath               import basename
+from posixpath               import dirname
+from posixpath               import join
+from posixpath               import normpath
+from zipfile                 import ZipFile
+from datetime                import datetime
+from typing                  import Any
+from typing                  import Iterator
+from os                      import stat
+from os.path                 import abspath
+
+
+class Archive:
+    def __init__(self, path: str) -> None:
+        self._zip_file = ZipFile(path)
+        self._names    = set(self.zip_file.namelist())
+        self._columns  = dict[str, int]()
+
+        workbook       = list(self.relationships('', OFFICE_DOCUMENT).values())
+        self._workbook = workbook[0] if workbook else WORKBOOK_PART
+        relationships  = self.relationships(self.workbook)
+        tree           = fromstring(self.zip_file.read(self.workbook))
+        properties     = tree.find(WORKBOOK)
+        self._epoch    = WINDOWS_EPOCH
+        if properties is not None and properties.get('date1904') in {'1', 'true'}:
+            self._epoch = MAC_EPOCH
+        self._sheets   = dict[str, str](
+            (sheet.get('name'), relationships[sheet.get(REFERENCE)])
+                for sheet in tree.iter(SHEET)
+        )
+
+        self._strings    = list[str]()
+        self._dates      = set[int]()
+        self._timedeltas = set[int]()
+
+        for part in self.relationships(self.workbook, SHARED_STRINGS).values():
+            with self.zip_file.open(part) as source:
+                for event, element in iterparse(source):
+                    if element.tag == STRING:
+                        self._strings.append(self.text(element).replace(ESCAPE, ''))
+                        element.clear()
+        for part in self.relationships(self.workbook, STYLES).values():
+            tree    = fromstring(self.zip_file.read(part))
+            formats = dict(
+                (int(element.get('numFmtId')), element.get('formatCode'))
+                    for element in tree.iter(NUMBER_FMT)
+            )
+            styles  = tree.find(CELL_XFS)
+            for index, style in enumerate(styles if styles is not None else ()):
+                id     = int(style.get('numFmtId', 0))
+                format = formats[id] if id in formats else BUILTIN_FORMATS.get(id)
+                if is_date_format(format):
+                    self._dates.add(index)
+                if is_timedelta_format(format):
+                    self._timedeltas.add(index)
+
+    @property
+    def zip_file(self) -> ZipFile:
+        return self._zip_file
+
+    @property
+    def workbook(self) -> str:
+        return self._workbook
+
+    @property
+    def epoch(self) -> datetime:
+        return self._epoch
+
+    @property
+    def sheets(self) -> dict[str, str]:
+        return self._sheets
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return list(self.sheets)
+
+    @property
+    def strings(self) -> list[str]:
+        return self._strings
+
+    def relationships(
+        self,
+        part: str,
+        type: str = None
+    ) -> dict[str, str]:
+        path    = join(dirname(part), '_rels', f'{basename(part)}.rels')
+        targets = dict[str, str]()
+        if path in self._names:
+            for relation in fromstring(self.zip_file.read(path)).iter(RELATION):
+                if type is None or relation.get('Type').endswith(type):
+                    target = relation.get('Target')
+                    if target.startswith('/'):
+                        target = target[1:]
+                    else:
+                        target = normpath(join(dirname(part), target))
+                    targets[relation.get('Id')] = target
+        return targets
+
+    def text(self, element: Element) -> str:
+        snippets = list[str]()
+        for child in element:
+            if child.tag == TEXT:
+                snippets.append(child.text or '')
+            elif child.tag == RUN:
+                snippets.append(child.findtext(TEXT) or '')
+        return ''.join(snippets)
+
+    def column(self, reference: str) -> int:
+        letters = reference.rstrip('0123456789')
+        if letters not in self._columns:
+            index = 0
+            for letter in letters:
+                index = index * 26 + ord(letter) - 64
+            self._columns[letters] = index
+        return self._columns[letters]
+
+    def value(self, cell: Element) -> Any:
+        type = cell.get('t', 'n')
+        if type == 'inlineStr':
+            child = cell.find(INLINE)
+            return None if child is None else self.text(child)
+
+        value = cell.findtext(VALUE) or None
+        if value is None:
+            return value
+        elif type == 'n':
+            if '.' in value or 'E' in value or 'e' in value:
+                value = float(value)
+            else:
+                value = int(value)
+            style = int(cell.get('s') or 0)
+            if style in self._dates:
+                try:
+                    return from_excel(value, self.epoch, timedelta=style in self._timedeltas)
+                except (OverflowError, ValueError):
+                    return INVALID
+            return value
+        elif type == 's':
+            return self.strings[int(value)]
+        elif type == 'b':
+            return bool(int(value))
+        elif type == 'd':
+            return from_ISO8601(value)
+        else:
+            return value
+
+    def rows(self, sheet: str) -> Iterator[tuple[Any, ...]]:
+        width  = None
+        height = None
+        empty  = tuple()
+        count  = 1
+        index  = 0
+        with self.zip_file.open(self.sheets[sheet]) as source:
+            for event, element in iterparse(source):
+                if element.tag == DIMENSION:
+                    width, height = range_boundaries(element.get('ref'))[2:]
+                    empty = (None,) * width if width else tuple()
+                elif element.tag == ROW:
+                    index = int(element.get('r') or index + 1)
+                    if height is not None and index > height:
+                        break
+                    while count < index:
+                        count += 1
+                        yield empty
+
+                    line   = dict[int, Any]()
+                    column = 0
+                    for cell in element:
+                        if cell.tag != CELL:
+                            continue
+                        reference = cell.get('r')
+                        column    = self.column(reference) if reference else column + 1
+                        line[column] = self.value(cell)
+                    element.clear()
+
+                    if count <= index:
+                        count += 1
+                        if not line and not width:
+                            yield tuple()
+                        else:
+                            row = [None] * (width or max(line))
+                            for column, value in line.items():
+                                if 1 <= column <= len(row):
+                                    row[column - 1] = value
+                            yield tuple(row)
+        if height is not None and height < index:
+            while count <= height:
+                count += 1
+                yield empty
+
+    def close(self) -> None:
+        self.zip_file.close()
+
+
+class ReadAgent:
+    def __init__(self) -> None:
+        self._sessions = dict[tuple[str, str], tuple[tuple[int, int], Workbook | Archive]]()
+
+    @property
+    def sessions(self) -> dict[tuple[str, str], tuple[tuple[int, int], Workbook | Archive]]:
+        return self._sessions
+
+    def stamp(self, path: str) -> tuple[int, int]:
+        status = stat(path)
+        return status.st_mtime_ns, status.st_size
+
+    def session(
+        self,
+        path  : str,
+        engine: str = None
+    ) -> Workbook | Archive:
+        engine = engine or ENGINE
+        key    = engine, abspath(path)
+        stamp  = self.stamp(path)
+        if key in self.sessions:
+            stamp_, session = self.sessions[key]
+            if stamp_ == stamp:
+                return session
+            session.close()
+        if engine == OPENPYXL:
+            session = load_workbook(
+                filename=path,
+                read_only=READ_ONLY,
+                data_only=DATA_ONLY
+            )
+        elif engine == XML:
+            session = Archive(path)
+        else:
+            raise Exception()
+        self.sessions[key] = stamp, session
+        return session
+
+    def workbook(self, path: str) -> Workbook:
+        return self.session(path, OPENPYXL)
+
+    def archive(self, path: str) -> Archive:
+        return self.session(path, XML)
+
+    def get_sheetnames(
+        self,
+        path  : str,
+        engine: str = None
+    ) -> list[str]:
+        return list(self.session(path, engine).sheetnames)
+
+    def rows(
+        self,
+        path  : str,
+        sheet : str,
+        engine: str = None
+    ) -> Iterator[tuple[Any, ...]]:
+        session = self.session(path, engine)
+        if isinstance(session, Archive):
+            return session.rows(sheet)
+        else:
+            return session[sheet].iter_rows(values_only=True)
+
+    def close(self, path: str = None) -> None:
+        for key in list(self.sessions):
+            if path is None or key[1] == abspath(path):
+                stamp, session = self.sessions.pop(key)
+                session.close()
+
+
+read_agent = ReadAgent()
@@ -0,0 +1,3 @@
+NONE = -1
+
+BATCHES = 4
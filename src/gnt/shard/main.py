@@ -0,0 +1,220 @@
+from src.gnt.shard.constants import *
+
+from src.cls.main        import Student
+from src.cls.main        import Subject
+from src.cls.main        import Reason
+from src.gnt.encode.main import EncodeAgent
+from src.gnt.enlist.main import EnlistAgent
+from src.gnt.enlist.main import Round
+from concurrent.futures  import ProcessPoolExecutor
+from os                  import cpu_count
+from typing              import Iterable
+from typing              import Iterator
+
+
+class Shard:
+    def __init__(
+        self,
+        students: list[int],
+        log     : list[tuple[list[tuple[int, str]], int, int]],
+        rankings: dict[int, dict[str, tuple[list[int], list[tuple[int, Reason]]]]],
+        rounds  : list[Round]
+    ) -> None:
+        self._students = students
+        self._log      = log
+        self._rankings = rankings
+        self._rounds   = rounds
+
+    @property
+    def students(self) -> list[int]:
+        return self._students
+
+    @property
+    def log(self) -> list[tuple[list[tuple[int, str]], int, int]]:
+        return self._log
+
+    @property
+    def rankings(self) -> dict[int, dict[str, tuple[list[int], list[tuple[int, Reason]]]]]:
+        return self._rankings
+
+    @property
+    def rounds(self) -> list[Round]:
+        return self._rounds
+
+
+class ShardAgent:
+    def __init__(self) -> None:
+        self._state = None
+
+    def __reduce__(self) -> str:
+        return 'shard_agent'
+
+    @property
+    def state(self) -> bytes | None:
+        return self._state
+
+    def load(self, state: bytes) -> None:
+        self._state = state
+
+    def keys(self, student: Student) -> Iterator[tuple[Subject, str]]:
+        for type in student.grade_level.to_rank:
+            for object in student.rankings.final.all(type):
+                for section in object.sections:
+                    if student.shift in {None, section.shift}:
+                        yield object, section.shift.id
+
+    def neighbours(self, student: Student) -> Iterator[Student]:
+        yield from student.prerequisites
+        yield from student.not_alongside
+        for group in student.memberships:
+            yield from group.students
+
+    def find(
+        self,
+        parents : list[int],
+        position: int
+    ) -> int:
+        while parents[position] != position:
+            parents[position] = parents[parents[position]]
+            position          = parents[position]
+        return position
+
+    def components(self, students: list[Student]) -> list[list[int]]:
+        parents   = list(range(len(students)))
+        positions = dict((student, position) for position, student in enumerate(students))
+        owners    = dict[tuple[Subject, str], int]()
+        for position, student in enumerate(students):
+            links = [
+                owners.setdefault(key, position)
+                    for key in self.keys(student)
+            ] + [
+                positions[other]
+                    for other in self.neighbours(student)
+                    if other in positions
+            ]
+            for other in links:
+                root, root_ = self.find(parents, position), self.find(parents, other)
+                if root != root_:
+                    parents[max(root, root_)] = min(root, root_)
+
+        components = dict[int, list[int]]()
+        for position in range(len(students)):
+            components.setdefault(self.find(parents, position), list()).append(position)
+        return list(components.values())
+
+    def batches(
+        self,
+        components: list[list[int]],
+        count     : int
+    ) -> list[list[int]]:
+        batches = [list[int]() for batch in range(max(1, count))]
+        for component in sorted(components, key=len, reverse=True):
+            min(batches, key=len).extend(component)
+        return [sorted(batch) for batch in batches if batch]
+
+    def solve(self, students: list[int]) -> Shard:
+        if self.state is None:
+            raise Exception()
+        model  = EncodeAgent()
+        model.thaw(self.state)
+        roster = [model.roster[index] for index in students]
+        log    = list()
+        rounds = EnlistAgent().enlist(roster, log=log)
+        return Shard(
+            students=students,
+            log=[
+                (
+                    [(student.index, type) for student, type in members],
+                    object.index,
+                    NONE if section is None else section.index
+                )
+                    for members, object, section in log
+            ],
+            rankings=dict(
+                (student.index, dict(
+                    (type, (
+                        [object.index for object in student.rankings.final.all(type)],
+                        [
+                            (object.index, reason)
+                                for object, reason in student.rankings.final.reason.get(type, list())
+                        ]
+                    ))
+                        for type in student.grade_level.to_rank
+                ))
+                    for student in roster
+            ),
+            rounds=rounds
+        )
+
+    def merge(
+        self,
+        encode_agent: EncodeAgent,
+        shards      : list[Shard]
+    ) -> list[Round]:
+        for shard in shards:
+            for members, object, section in shard.log:
+                object = encode_agent.catalog[object]
+                if len(members) > 1:
+                    object.seat_block(
+                        [(encode_agent.roster[index], type) for index, type in members],
+                        encode_agent.sections[section]
+                    )
+                    continue
+                index, type = members[0]
+                student  = encode_agent.roster[index]
+                sections = None if section == NONE else [encode_agent.sections[section]]
+                if isinstance(object, Subject):
+                    qualified, reason = student.add_subject(type, object, sections)
+                else:
+                    qualified, reason = student.add_category(type, object, sections)
+                if not qualified:
+                    raise Exception(reason)
+            for index, rankings in shard.rankings.items():
+                final = encode_agent.roster[index].rankings.final
+                for type, (ordered, reasons) in rankings.items():
+                    final.clear(type)
+                    for object in ordered:
+                        final.add(type, encode_agent.catalog[object])
+                    if reasons:
+                        final.reason[type] = [(encode_agent.catalog[object], reason) for object, reason in reasons]
+                    else:
+                        final.reason.pop(type, None)
+
+        rounds = list[Round]()
+        for index in range(max((len(shard.rounds) for shard in shards), default=0)):
+            rounds_ = [shard.rounds[index] for shard in shards if index < len(shard.rounds)]
+            rounds.append(Round(
+                index=index + 1,
+                proposals=sum(round.proposals for round in rounds_),
+                accepted=sum(round.accepted for round in rounds_),
+                rejected=sum(round.rejected for round in rounds_),
+                exhausted=sum(round.exhausted for round in rounds_),
+                elapsed=max(round.elapsed for round in rounds_)
+            ))
+        return rounds
+
+    def enlist(
+        self,
+        encode_agent: EncodeAgent,
+        students    : Iterable[Student] = None,
+        workers     : int               = None
+    ) -> list[Round]:
+        students = list(encode_agent.roster if students is None else students)
+        workers  = workers or cpu_count() or 1
+        if any(student.index is None for student in students):
+            raise Exception()
+
+        batches  = self.batches(self.components(students), workers * BATCHES)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=self.load,
+            initargs=(encode_agent.freeze(),)
+        ) as executor:
+            shards = list(executor.map(
+                self.solve,
+                [[students[position].index for position in batch] for batch in batches]
+            ))
+        return self.merge(encode_agent, shards)
+
+
+shard_agent = ShardAgent()
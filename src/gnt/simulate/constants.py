@@ -0,0 +1,8 @@
+RUNS = 100
+SEED = 0
+
+SCENARIO_TEMPLATE = 'Seed {}: {:.1%} filled, {:.1%} first choice, mean rank {:.2f}'
+SUMMARY_TEMPLATE  = (
+    '{} runs: fill rate {:.1%} ± {:.1%} [{:.1%}, {:.1%}], '
+    'first choice {:.1%} ± {:.1%}, mean rank {:.2f} ({:.1f} runs/s)'
+)
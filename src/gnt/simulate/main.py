@@ -0,0 +1,207 @@
+from src.gnt.simulate.constants import *
+
+from src.gnt.encode.main        import EncodeAgent
+from src.gnt.enlist.main        import EnlistAgent
+from concurrent.futures         import ProcessPoolExecutor
+from random                     import Random
+from statistics                 import fmean
+from statistics                 import pstdev
+from time                       import perf_counter
+from os                         import cpu_count
+
+
+class Scenario:
+    def __init__(
+        self,
+        seed   : int,
+        total  : int,
+        placed : int = None,
+        first  : int = None,
+        ranks  : int = None,
+        rounds : int = None,
+        elapsed: float = None
+    ) -> None:
+        self._seed    = seed
+        self._total   = total
+        self._placed  = placed or int()
+        self._first   = first or int()
+        self._ranks   = ranks or int()
+        self._rounds  = rounds or int()
+        self._elapsed = elapsed or float()
+
+    def __repr__(self) -> str:
+        return SCENARIO_TEMPLATE.format(
+            self.seed,
+            self.fill_rate,
+            self.first_choice,
+            self.mean_rank
+        )
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    @property
+    def placed(self) -> int:
+        return self._placed
+
+    @property
+    def first(self) -> int:
+        return self._first
+
+    @property
+    def ranks(self) -> int:
+        return self._ranks
+
+    @property
+    def rounds(self) -> int:
+        return self._rounds
+
+    @property
+    def elapsed(self) -> float:
+        return self._elapsed
+
+    @property
+    def fill_rate(self) -> float:
+        return self.placed / self.total if self.total else float()
+
+    @property
+    def first_choice(self) -> float:
+        return self.first / self.total if self.total else float()
+
+    @property
+    def mean_rank(self) -> float:
+        return self.ranks / self.placed if self.placed else float()
+
+
+class Summary:
+    def __init__(
+        self,
+        scenarios: list[Scenario],
+        elapsed  : float = None
+    ) -> None:
+        self._scenarios = scenarios
+        self._elapsed   = elapsed or float()
+
+    def __repr__(self) -> str:
+        fill_rates = self.fill_rates
+        return SUMMARY_TEMPLATE.format(
+            len(self.scenarios),
+            fmean(fill_rates),
+            pstdev(fill_rates),
+            min(fill_rates),
+            max(fill_rates),
+            fmean(self.first_choices),
+            pstdev(self.first_choices),
+            fmean(self.mean_ranks),
+            self.throughput
+        )
+
+    @property
+    def scenarios(self) -> list[Scenario]:
+        return self._scenarios
+
+    @property
+    def elapsed(self) -> float:
+        return self._elapsed
+
+    @property
+    def fill_rates(self) -> list[float]:
+        return [scenario.fill_rate for scenario in self.scenarios]
+
+    @property
+    def first_choices(self) -> list[float]:
+        return [scenario.first_choice for scenario in self.scenarios]
+
+    @property
+    def mean_ranks(self) -> list[float]:
+        return [scenario.mean_rank for scenario in self.scenarios]
+
+    @property
+    def throughput(self) -> float:
+        return len(self.scenarios) / self.elapsed if self.elapsed else float()
+
+
+class SimulateAgent:
+    def __init__(self) -> None:
+        self._state = None
+
+    def __reduce__(self) -> str:
+        return 'simulate_agent'
+
+    @property
+    def state(self) -> bytes | None:
+        return self._state
+
+    def load(self, state: bytes) -> None:
+        self._state = state
+
+    def model(self) -> EncodeAgent:
+        if self.state is None:
+            raise Exception()
+        model = EncodeAgent()
+        model.thaw(self.state)
+        return model
+
+    def scenario(self, seed: int) -> Scenario:
+        start    = perf_counter()
+        model    = self.model()
+        students = list(model.roster)
+        Random(seed).shuffle(students)
+        rounds   = EnlistAgent().enlist(students)
+
+        total  = 0
+        placed = 0
+        first  = 0
+        ranks  = 0
+        for student in students:
+            for type in student.grade_level.to_rank:
+                choices = student.rankings.initial.all(type)
+                if not choices:
+                    continue
+                total   += 1
+                subject  = student.subjects.get(type) or student.categories.get(type)
+                if subject in choices:
+                    rank    = choices.index(subject) + 1
+                    placed += 1
+                    first  += rank == 1
+                    ranks  += rank
+        return Scenario(
+            seed=seed,
+            total=total,
+            placed=placed,
+            first=first,
+            ranks=ranks,
+            rounds=len(rounds),
+            elapsed=perf_counter() - start
+        )
+
+    def simulate(
+        self,
+        encode_agent: EncodeAgent,
+        runs        : int = None,
+        seed        : int = None,
+        workers     : int = None
+    ) -> Summary:
+        runs    = runs or RUNS
+        seed    = seed or SEED
+        workers = workers or cpu_count() or 1
+        start   = perf_counter()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=self.load,
+            initargs=(encode_agent.freeze(),)
+        ) as executor:
+            scenarios = list(executor.map(
+                self.scenario,
+                range(seed, seed + runs),
+                chunksize=max(1, runs // (4 * workers))
+            ))
+        return Summary(scenarios, perf_counter() - start)
+
+
+simulate_agent = SimulateAgent()
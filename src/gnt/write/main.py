@@ -27,11 +27,15 @@ class WriterAgent:
         if not exists(path):
             self.generate_xlsx(path)
 
-        workbook = load_workbook(filepath=path)
+        workbook = load_workbook(filename=path)
         if DEFAULT_SHEETNAME in workbook.sheetnames:
             workbook.remove(workbook[DEFAULT_SHEETNAME])
 
-        worksheet = workbook.create_sheet(title=sheet)
+        index = None
+        if sheet in workbook.sheetnames:
+            index = workbook.sheetnames.index(sheet)
+            workbook.remove(workbook[sheet])
+        worksheet = workbook.create_sheet(title=sheet, index=index)
         for row in data:
             worksheet.append(
                 self.as_text(cell)
@@ -0,0 +1,94 @@
+from src.cls.main        import Section
+from src.cls.main        import ParallelSession
+from src.cls.main        import Capacity
+from src.cls.main        import Student
+from src.cls.main        import Group
+from src.gnt.encode.main import EncodeAgent
+from random              import Random
+
+SUBJECTS = 'input/Test data_ Subjects.xlsx'
+STUDENTS = 'input/Test data_ Students.xlsx'
+
+
+def build(
+    count   : int = 0,
+    sections: int = 4,
+    maximum : int = 30,
+    seed    : int = 0
+) -> EncodeAgent:
+    random       = Random(seed)
+    encode_agent = EncodeAgent()
+    encode_agent.encode_subjects(SUBJECTS)
+    shifts = sorted(encode_agent.shifts.values(), key=str)
+    for name, (data, subject) in list(encode_agent.subjects.items()):
+        for index in range(sections):
+            shift   = shifts[index % len(shifts)]
+            section = Section(
+                parent=subject,
+                shift=shift,
+                parallel_session=ParallelSession(
+                    shift=shift,
+                    partition=sorted(shift.partitions)[index % len(shift.partitions)]
+                ),
+                capacity=Capacity(0, maximum, maximum),
+                index=len(encode_agent.sections)
+            )
+            subject.add_section(section)
+            encode_agent.sections.append(section)
+    encode_agent.encode_students(STUDENTS)
+
+    originals = list(encode_agent.roster)
+    while len(encode_agent.roster) < count:
+        original = originals[len(encode_agent.roster) % len(originals)]
+        student  = Student(
+            id=f'{original.id}-{len(encode_agent.roster)}',
+            grade_level=original.grade_level,
+            index=len(encode_agent.roster)
+        )
+        if original.previous is not None:
+            student.previous = original.previous
+        for type in sorted(original.grade_level.to_rank):
+            ranked = list(original.rankings.initial.all(type))
+            random.shuffle(ranked)
+            for object in ranked:
+                student.rankings.add(type, object)
+        encode_agent.roster.append(student)
+        encode_agent.students[student.grade_level].append(student)
+    return encode_agent
+
+
+def placements(encode_agent: EncodeAgent) -> list[tuple]:
+    return [
+        (
+            student.id,
+            type,
+            str(student.subjects.get(type) or student.categories.get(type)),
+            str(student.sections.get(student.subjects.get(type) or student.categories.get(type))),
+            student.rankings.final.render(type)
+        )
+            for student in encode_agent.roster
+            for type in sorted(student.grade_level.to_rank)
+    ]
+
+
+def group(
+    encode_agent: EncodeAgent,
+    size        : int = 3
+) -> list[Student]:
+    candidates = dict[tuple, list[Student]]()
+    for student in encode_agent.roster:
+        for type in sorted(student.grade_level.to_rank):
+            if student.rankings.final.count(type) and student.rankings.final.get(type).sections:
+                key = (student.grade_level, student.shift, type, student.rankings.final.get(type))
+                candidates.setdefault(key, list()).append(student)
+    (grade_level, shift, type, subject), members = next(
+        (key, members[:size])
+            for key, members in candidates.items()
+            if len(members) >= size
+    )
+    subject._max_group_members = max(subject.max_group_members, size)
+    required = Group(id='Block', parent=subject, required=True)
+    for student in members:
+        required.add_student(student)
+    members[0].add_prerequisite(members[1])
+    return members
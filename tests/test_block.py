@@ -0,0 +1,50 @@
+from helpers              import build
+from helpers              import group
+from helpers              import placements
+from src.gnt.encode.main  import EncodeAgent
+from src.gnt.enlist.main  import EnlistAgent
+from src.gnt.delta.main   import delta_agent
+from src.gnt.journal.main import journal_agent
+from src.gnt.shard.main   import shard_agent
+
+
+def together(members) -> bool:
+    subject = members[0].rankings.initial.get(sorted(members[0].grade_level.to_rank)[0])
+    return len(set(student.sections.get(subject) for student in members)) == 1 \
+        and members[0].sections.get(subject) is not None
+
+
+def test_delta_replays_block() -> None:
+    encode_agent = build()
+    members      = group(encode_agent)
+    enlistment   = delta_agent.start(encode_agent.roster)
+    expected     = placements(encode_agent)
+    assert together(members)
+
+    enlistment.restore(enlistment.rewind(0))
+    assert placements(encode_agent) == expected
+
+
+def test_journal_replays_block(tmp_path) -> None:
+    encode_agent = build()
+    members      = group(encode_agent)
+    journal      = journal_agent.open(str(tmp_path), encode_agent, encode_agent.roster)
+    EnlistAgent().enlist(encode_agent.roster, journal=journal)
+    journal.close()
+    assert together(members)
+
+    model = EncodeAgent()
+    journal_agent.replay(str(tmp_path), model)
+    assert placements(model) == placements(encode_agent)
+
+
+def test_shard_merges_block() -> None:
+    reference = build()
+    group(reference)
+    EnlistAgent().enlist(reference.roster)
+
+    encode_agent = build()
+    members      = group(encode_agent)
+    shard_agent.enlist(encode_agent, workers=2)
+    assert together(members)
+    assert placements(encode_agent) == placements(reference)
@@ -0,0 +1,18 @@
+from helpers             import SUBJECTS
+from helpers             import STUDENTS
+from src.gnt.encode.main import EncodeAgent
+
+
+def test_truncated_snapshot(tmp_path) -> None:
+    path = str(tmp_path / 'Encoded.snapshot')
+    EncodeAgent().encode(SUBJECTS, STUDENTS, path)
+    with open(path, 'rb') as file:
+        data = file.read()
+    with open(path, 'wb') as file:
+        file.write(data[:len(data) // 2])
+
+    encode_agent = EncodeAgent()
+    assert not encode_agent.restore(path, SUBJECTS, STUDENTS)
+    encode_agent.encode(SUBJECTS, STUDENTS, path)
+    assert len(encode_agent.roster) == 466
+    assert EncodeAgent().restore(path, SUBJECTS, STUDENTS)
@@ -0,0 +1,40 @@
+from helpers             import build
+from src.cls.main        import Reason
+from src.gnt.enlist.main import EnlistAgent
+
+
+def test_closed_subject_rejects() -> None:
+    encode_agent = build(sections=1)
+    student      = encode_agent.roster[0]
+    type         = sorted(student.grade_level.to_rank)[0]
+    subject      = student.rankings.final.get(type)
+    for section in list(subject.sections):
+        subject.close(section)
+
+    assert subject.closed
+    assert not student.propose(type)
+    assert subject not in student.sections
+    assert student.rankings.final.last(type) == Reason.CLOSED
+    assert not subject.admit([student])
+
+
+def test_repair_reports_stranded() -> None:
+    encode_agent     = build(sections=1)
+    student, subject = next(
+        (student, subject)
+            for student in encode_agent.roster
+            for type, subject in student.subjects.items()
+            if type not in student.grade_level.to_rank and subject is not None
+    )
+    section   = student.sections[subject]
+    displaced = sorted(section.students, key=str)
+    raised    = section.capacity.filled + 1 - section.capacity.minimum
+    section.capacity.minimum += raised
+    subject.capacity.minimum += raised
+
+    repair = EnlistAgent().repair([section])[0]
+    assert displaced and repair.closed == 1
+    assert [student_ for student_, object in repair.stranded] == displaced
+    assert all(object == subject for student_, object in repair.stranded)
+    assert subject not in student.attends
+    assert len(repair.rows()) == len(displaced)
@@ -0,0 +1,53 @@
+from helpers             import build
+from helpers             import placements
+from src.gnt.enlist.main import EnlistAgent
+from src.gnt.flow.main   import flow_agent
+from random              import Random
+from pytest              import mark
+
+
+def satisfaction(encode_agent) -> tuple[int, int]:
+    placed = 0
+    ranks  = 0
+    for student in encode_agent.roster:
+        for type in student.grade_level.to_rank:
+            object = student.subjects.get(type) or student.categories.get(type)
+            if object is not None:
+                placed += 1
+                ranks  += student.rankings.initial.all(type).index(object)
+    return placed, -ranks
+
+
+@mark.parametrize('count, sections, maximum', [(466, 2, 20), (466, 4, 30), (932, 4, 30)])
+def test_flow_satisfies_more_than_greedy(
+    count   : int,
+    sections: int,
+    maximum : int
+) -> None:
+    greedy = build(count, sections, maximum)
+    EnlistAgent().enlist(greedy.roster)
+    optimal = build(count, sections, maximum)
+    flow_agent.enlist(optimal.roster)
+
+    assert satisfaction(optimal) > satisfaction(greedy)
+    assert all(
+        section.capacity.filled <= section.capacity.maximum
+            for section in optimal.sections
+    )
+    for student in optimal.roster:
+        for type in student.grade_level.to_rank:
+            object = student.subjects.get(type) or student.categories.get(type)
+            if object is not None:
+                assert student.rankings.final.get(type) == object
+
+
+@mark.parametrize('seed', [1, 2])
+def test_flow_ignores_roster_order(seed: int) -> None:
+    ordered = build(932, 4, 30)
+    flow_agent.enlist(ordered.roster)
+    shuffled = build(932, 4, 30)
+    roster   = list(shuffled.roster)
+    Random(seed).shuffle(roster)
+    flow_agent.enlist(roster)
+
+    assert placements(shuffled) == placements(ordered)
@@ -0,0 +1,83 @@
+from helpers                  import build
+from helpers                  import placements
+from src.gnt.encode.main      import EncodeAgent
+from src.gnt.enlist.main      import EnlistAgent
+from src.gnt.journal.main     import Journal
+from src.gnt.journal.main     import journal_agent
+from src.gnt.eligibility.main import eligibility_agent
+from pytest                   import mark
+from pytest                   import raises
+
+
+def test_freeze_enlisted_roster() -> None:
+    encode_agent = build(3000)
+    EnlistAgent().enlist(encode_agent.roster)
+    model = EncodeAgent()
+    model.thaw(encode_agent.freeze())
+    assert placements(model) == placements(encode_agent)
+    assert [
+        (section.capacity.filled, sorted(student.index for student in section.students))
+            for section in model.sections
+    ] == [
+        (section.capacity.filled, sorted(student.index for student in section.students))
+            for section in encode_agent.sections
+    ]
+
+
+def test_checkpoint_resume(tmp_path) -> None:
+    reference = build(3000)
+    EnlistAgent().enlist(reference.roster)
+
+    encode_agent = build(3000)
+    journal      = journal_agent.open(str(tmp_path), encode_agent, encode_agent.roster, 1)
+    EnlistAgent().enlist(
+        encode_agent.roster,
+        eligibility_agent.build(encode_agent.roster, encode_agent.sections),
+        journal=journal
+    )
+    journal.close()
+
+    model             = EncodeAgent()
+    journal, students = journal_agent.resume(str(tmp_path), model, 1)
+    EnlistAgent().enlist(students, journal=journal)
+    journal.close()
+    assert placements(model) == placements(reference)
+
+
+class Interrupt(Exception):
+    pass
+
+
+@mark.parametrize('round', [1, 2, 3])
+def test_resume_interrupted_run(tmp_path, monkeypatch, round) -> None:
+    reference = build(3000)
+    EnlistAgent().enlist(reference.roster)
+
+    commit = Journal.commit
+    def interrupt(journal: Journal) -> None:
+        if journal.round + 1 == round:
+            raise Interrupt()
+        commit(journal)
+    monkeypatch.setattr(Journal, 'commit', interrupt)
+
+    encode_agent = build(3000)
+    journal      = journal_agent.open(str(tmp_path), encode_agent, encode_agent.roster, 2)
+    with raises(Interrupt):
+        EnlistAgent().enlist(
+            encode_agent.roster,
+            eligibility_agent.build(encode_agent.roster, encode_agent.sections),
+            journal=journal
+        )
+    journal.close()
+    monkeypatch.setattr(Journal, 'commit', commit)
+
+    model             = EncodeAgent()
+    journal, students = journal_agent.resume(str(tmp_path), model, 2)
+    assert journal.round == round - 1
+    EnlistAgent().enlist(
+        students,
+        eligibility_agent.build(students, model.sections),
+        journal=journal
+    )
+    journal.close()
+    assert placements(model) == placements(reference)
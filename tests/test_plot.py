@@ -0,0 +1,33 @@
+from helpers             import build
+from helpers             import SUBJECTS
+from helpers             import STUDENTS
+from src.gnt.encode.main import EncodeAgent
+from src.gnt.plot.main   import plot_agent
+from src.gnt.write.main  import writer_agent
+from shutil              import copyfile
+
+
+def test_write_keeps_unplotted_sections(tmp_path) -> None:
+    path         = str(tmp_path / 'Subjects.xlsx')
+    encode_agent = build(1000)
+    plot         = plot_agent.plot(encode_agent, 10, 30, 40)
+    fixed        = next(object for object in encode_agent.catalog if object not in plot.sections)
+    shift        = next(iter(encode_agent.shifts.values()))
+    partition    = sorted(shift.partitions)[0]
+    copyfile(SUBJECTS, path)
+
+    rows = plot_agent.rows(plot, encode_agent.catalog)
+    for row in rows:
+        if row[0] == fixed:
+            row[1:] = [1, partition, 1, shift, 5, 20, 25]
+    writer_agent.write_to_xlsx(path, 'Sections', rows)
+    plot_agent.write(path, plot, encode_agent)
+
+    model = EncodeAgent()
+    model.encode_subjects(path)
+    model.encode_students(STUDENTS)
+    assert [
+        (section.parallel_session.partition, section.capacity.maximum)
+            for section in model.find(str(fixed)).sections
+    ] == [(partition, 25)]
+    assert len(model.sections) == plot.count + 1